@@ -7,6 +7,12 @@ SAMPLE_RATE = 48000  # 48 kHz (standard for many devices)
 CHANNELS = 2  # Stereo
 AUDIO_DTYPE = 'float32'
 BUFFER_SIZE = 1024
+WARMUP_MIN_MS = 200  # Audio a new stream must deliver before levels and progress are reported
+WARMUP_MIN_BUFFERS = 16  # ...or this many buffers, whichever comes first
+PROGRESS_INTERVAL_S = 0.1  # How often the recording thread reports elapsed time while PortAudio captures
+ARENA_INITIAL_SECONDS = 60  # Capture buffer preallocated for recordings without a timer (doubles when full)
+ARENA_MAX_PREALLOC_SECONDS = 300  # Cap on the buffer preallocated for a timer (~110 MB at 48 kHz stereo float32)
+RING_BUFFER_SAMPLES = 1 << 20  # Samples queued between the audio callback and the writer thread (~10 s at 48 kHz stereo)
 
 # MP3 Encoding Settings
 MP3_BITRATE_OPTIONS = {
@@ -16,13 +22,21 @@ MP3_BITRATE_OPTIONS = {
     'Very High': 320
 }
 DEFAULT_MP3_BITRATE = 192
+# Combobox labels and bitrates, in the same order
+QUALITY_DISPLAY_OPTIONS = tuple(f"{name} ({bitrate} kbps)" for name, bitrate in MP3_BITRATE_OPTIONS.items())
+QUALITY_BITRATES = tuple(MP3_BITRATE_OPTIONS.values())
 MP3_QUALITY = 2  # 0 = best quality, 9 = worst quality
+ENCODE_CHUNK_FRAMES = SAMPLE_RATE  # Frames converted and fed to LAME per block (~1 second)
+PIPELINE_QUEUE_SIZE = 4  # Blocks buffered between read, encode and write stages
 
 # File Settings
 OUTPUT_FOLDER = "aufnahmen"
 TEMP_FILE_PREFIX = "temp_"
 OUTPUT_FILE_PREFIX = "aufnahme_"
 TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+WRITE_BUFFER_SIZE = 2 * 1024 * 1024  # 2 MiB buffer for coalescing MP3 output writes
+STATE_FILE = "musik_snip_state.json"  # Remembers the last output folder between sessions
+FOLDER_CHECK_TIMEOUT_S = 0.5  # Max wait for the folder dialog's start folder to respond
 
 # GUI Settings
 WINDOW_TITLE = "🎙️ System Audio Recorder"
@@ -45,6 +59,11 @@ COLOR_WARNING = "orange"
 DEFAULT_TIMER_MINUTES = 5
 UPDATE_INTERVAL_MS = 100  # Update UI every 100ms
 TIMER_DISPLAY_INTERVAL_MS = 1000  # Update timer display every second
+TICK_ALIGN_SLACK_MS = 50  # Fire display ticks this long after the second rolls over
+DEVICE_CACHE_TTL_S = 30  # Seconds before the audio device list is enumerated again
+WORKER_THREADS = 4  # Background threads shared by recording, saving and device scans
+LEVEL_FPS = 15  # Level meter updates per second pushed to the GUI
+LEVEL_SMOOTHING = 0.8  # Weight of the previous level in the meter's moving average (0 = none)
 
 # Memory Management
 MAX_MEMORY_MB = 500  # Maximum memory usage before writing to disk
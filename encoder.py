@@ -2,17 +2,162 @@
 MP3 encoding functionality for audio data.
 """
 
+import gc
 import os
+import sys
+import queue
 import logging
+import contextlib
+import threading
+import importlib.util
 import numpy as np
-import lameenc
-from typing import Optional
+from typing import Optional, Iterable, Iterator, TYPE_CHECKING
 
-from config import MP3_QUALITY, SAMPLE_RATE, CHANNELS
+# lameenc and numba are imported on first use to keep application start-up fast
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+from config import (
+    MP3_QUALITY, SAMPLE_RATE, CHANNELS, ENCODE_CHUNK_FRAMES, WRITE_BUFFER_SIZE,
+    PIPELINE_QUEUE_SIZE
+)
+
+if TYPE_CHECKING:
+    import lameenc
 
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a pipeline queue
+_END_OF_STREAM = object()
+
+
+_pcm16_kernel = None  # Compiled Numba kernel, built on first use
+_pcm16_kernel_failed = False  # numba is installed but the kernel could not be built
+
+# float32 constants, so the conversion math stays in float32 instead of
+# promoting every sample to float64 (Numba freezes these at compile time)
+_PCM16_SCALE = np.float32(32767.0)
+_PCM16_MAX = np.float32(32767.0)
+_PCM16_MIN = np.float32(-32768.0)
+_lame_accepts_arrays = True  # Cleared if lameenc rejects ndarray input
+
+
+def _get_pcm16_kernel():
+    """
+    Import Numba and compile the float32 -> int16 kernel on first use.
+
+    Returns:
+        The compiled kernel, or None if numba is not installed or the kernel
+        could not be built; callers then use the NumPy conversion
+    """
+    global _pcm16_kernel, _pcm16_kernel_failed
+    if _pcm16_kernel is not None or not NUMBA_AVAILABLE or _pcm16_kernel_failed:
+        return _pcm16_kernel
+
+    try:
+        import numba
+        prange = numba.prange
+
+        def f32_to_i16_saturate(src, dst):
+            """Scale, saturate and store float32 samples as int16 in a single pass."""
+            for i in prange(src.shape[0]):
+                v = src[i] * _PCM16_SCALE
+                if v > _PCM16_MAX:
+                    v = _PCM16_MAX
+                elif v < _PCM16_MIN:
+                    v = _PCM16_MIN
+                dst[i] = np.int16(v)
+
+        kernel = numba.njit(
+            parallel=True, fastmath=True, boundscheck=False, cache=True
+        )(f32_to_i16_saturate)
+        # Compile now, so a broken numba install shows up here and not mid-encode
+        kernel(np.zeros(1, dtype=np.float32), np.empty(1, dtype=np.int16))
+    except Exception as e:
+        logger.warning(f"Numba PCM kernel unavailable, using NumPy: {e}")
+        _pcm16_kernel_failed = True
+        return None
+
+    _pcm16_kernel = kernel
+    return _pcm16_kernel
+
+
+def _lame_encode(encoder: "lameenc.Encoder", pcm: np.ndarray) -> bytes:
+    """
+    Hand a C-contiguous int16 array to LAME without a bytes copy.
+
+    Falls back to tobytes() for lameenc versions that only accept bytes.
+    """
+    global _lame_accepts_arrays
+    if _lame_accepts_arrays:
+        try:
+            return encoder.encode(pcm)
+        except TypeError:
+            _lame_accepts_arrays = False
+            logger.debug("lameenc does not accept arrays, falling back to bytes")
+    return encoder.encode(pcm.tobytes())
+
+
+def _put_unless_stopped(q: queue.Queue, item, stop_event: threading.Event) -> bool:
+    """
+    Put an item into a bounded queue, giving up once stop_event is set.
+
+    Returns:
+        True if the item was queued, False if the pipeline was stopped
+    """
+    while not stop_event.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_ahead(blocks: Iterable[np.ndarray],
+                maxsize: int = PIPELINE_QUEUE_SIZE) -> Iterator[np.ndarray]:
+    """
+    Iterate over blocks that are produced by a background reader thread.
+
+    The reader stays up to maxsize blocks ahead of the consumer, so disk
+    reads overlap with encoding. Errors in the reader are re-raised in the
+    consumer.
+
+    Args:
+        blocks: Iterable of audio blocks (e.g. from soundfile)
+        maxsize: Maximum number of blocks buffered between the threads
+
+    Yields:
+        Audio blocks in order
+    """
+    block_queue = queue.Queue(maxsize=maxsize)
+    stop_event = threading.Event()
+
+    def reader():
+        try:
+            for block in blocks:
+                if not _put_unless_stopped(block_queue, block, stop_event):
+                    return
+        except Exception as e:
+            _put_unless_stopped(block_queue, e, stop_event)
+            return
+        _put_unless_stopped(block_queue, _END_OF_STREAM, stop_event)
+
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    reader_thread.start()
+
+    try:
+        while True:
+            item = block_queue.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop_event.set()
+        reader_thread.join()
+
 
 class MP3EncoderError(Exception):
     """Custom exception for MP3 encoding errors."""
@@ -38,15 +183,176 @@ class MP3Encoder:
         """
         self.bitrate = bitrate
         self.quality = quality
+        # Configured but unused LAME encoders, keyed by their settings
+        self._lame_cache = {}
+        # Per-block conversion buffers, allocated on first use and reused
+        self._float_scratch: Optional[np.ndarray] = None
+        self._i16_scratch: Optional[np.ndarray] = None
         logger.info(f"MP3Encoder initialized with bitrate={bitrate}, quality={quality}")
 
-    def encode(self, audio_data: np.ndarray, output_file: str) -> bool:
+    def close(self) -> None:
+        """
+        Release scratch buffers and prepared LAME encoders.
+
+        The encoder stays usable; buffers are reallocated on the next encode.
+        """
+        self._float_scratch = None
+        self._i16_scratch = None
+        self._lame_cache = {}
+        if sys.platform == "win32":
+            # Return freed arenas to the OS between recordings
+            gc.collect()
+        logger.debug("MP3Encoder buffers released")
+
+    def _to_pcm16(self, block: np.ndarray) -> np.ndarray:
+        """
+        Convert a block of float audio (-1.0 to 1.0) to saturated int16 PCM.
+
+        The conversion writes into scratch buffers kept on the instance, so
+        no temporaries are allocated per block.
+
+        Args:
+            block: NumPy array with float audio data
+
+        Returns:
+            C-contiguous int16 view of the scratch buffer with the shape of
+            block; only valid until the next call
+        """
+        size = block.size
+        if self._i16_scratch is None or self._i16_scratch.size < size:
+            self._i16_scratch = np.empty(size, dtype=np.int16)
+
+        pcm = self._i16_scratch[:size].reshape(block.shape)
+
+        kernel = _get_pcm16_kernel()
+        if kernel is not None:
+            src = np.ascontiguousarray(block, dtype=np.float32)
+            kernel(src.reshape(-1), pcm.reshape(-1))
+        else:
+            if self._float_scratch is None or self._float_scratch.size < size:
+                self._float_scratch = np.empty(size, dtype=np.float32)
+            # Clip first, then scale straight into the int16 buffer: two
+            # passes over the block instead of scale, clip and copy
+            clipped = self._float_scratch[:size].reshape(block.shape)
+            np.clip(block, -1.0, 1.0, out=clipped)
+            np.multiply(clipped, _PCM16_SCALE, out=pcm, casting='unsafe')
+
+        return pcm
+
+    def _create_lame_encoder(self, sample_rate: int, channels: int) -> "lameenc.Encoder":
+        """
+        Create a LAME encoder configured with the current settings.
+
+        Args:
+            sample_rate: Input sample rate in Hz
+            channels: Number of input channels
+
+        Returns:
+            Configured lameenc.Encoder
+        """
+        import lameenc
+
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(self.bitrate)
+        encoder.set_in_sample_rate(sample_rate)
+        encoder.set_channels(channels)
+        encoder.set_quality(self.quality)
+        return encoder
+
+    def _acquire_lame_encoder(self, sample_rate: int, channels: int) -> "lameenc.Encoder":
+        """
+        Take a prepared LAME encoder for these settings, or create one.
+
+        LAME encoders cannot be reused after flush(), so a cached encoder is
+        removed from the cache when it is handed out.
+        """
+        key = (self.bitrate, self.quality, sample_rate, channels)
+        encoder = self._lame_cache.pop(key, None)
+        if encoder is None:
+            encoder = self._create_lame_encoder(sample_rate, channels)
+        return encoder
+
+    def prepare(self, sample_rate: int, channels: int) -> None:
+        """
+        Create a LAME encoder ahead of time for the next encode.
+
+        Call this while recording, so that the next encode with the same
+        settings skips encoder initialization.
+
+        Args:
+            sample_rate: Input sample rate in Hz
+            channels: Number of input channels
+        """
+        key = (self.bitrate, self.quality, sample_rate, channels)
+        if key not in self._lame_cache:
+            self._lame_cache[key] = self._create_lame_encoder(sample_rate, channels)
+            logger.debug(f"Prepared LAME encoder for {key}")
+
+    def _encode_blocks(self, blocks: Iterable[np.ndarray], output_file: str,
+                       sample_rate: int, channels: int) -> None:
+        """
+        Encode float audio blocks to an MP3 file.
+
+        LAME output for each block is handed to a writer thread that streams
+        it to a large write buffer, so disk writes overlap with encoding and
+        memory use stays bounded regardless of length.
+
+        Args:
+            blocks: Iterable of float (range -1.0 to 1.0) or int16 audio blocks
+            output_file: Path to output MP3 file
+            sample_rate: Input sample rate in Hz
+            channels: Number of input channels
+        """
+        encoder = self._acquire_lame_encoder(sample_rate, channels)
+
+        write_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        write_errors = []
+
+        with open(output_file, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            def writer():
+                # Keep draining after an error so the encoder never blocks
+                while True:
+                    mp3_data = write_queue.get()
+                    if mp3_data is _END_OF_STREAM:
+                        return
+                    if write_errors:
+                        continue
+                    try:
+                        f.write(mp3_data)
+                    except Exception as e:
+                        write_errors.append(e)
+
+            writer_thread = threading.Thread(target=writer, daemon=True)
+            writer_thread.start()
+
+            try:
+                for block in blocks:
+                    if write_errors:
+                        break
+                    if block.dtype == np.int16:
+                        pcm_block = np.ascontiguousarray(block)
+                    else:
+                        pcm_block = self._to_pcm16(block)
+                    write_queue.put(_lame_encode(encoder, pcm_block))
+                else:
+                    write_queue.put(encoder.flush())
+            finally:
+                write_queue.put(_END_OF_STREAM)
+                writer_thread.join()
+
+        if write_errors:
+            raise write_errors[0]
+
+    def encode(self, audio_data: np.ndarray, output_file: str,
+               sample_rate: int = SAMPLE_RATE) -> bool:
         """
         Encode audio data to MP3 format.
 
         Args:
-            audio_data: NumPy array with audio data (float32, range -1.0 to 1.0)
+            audio_data: NumPy array with audio data (float32, range -1.0 to 1.0),
+                shape (samples,) for mono or (samples, channels)
             output_file: Path to output MP3 file
+            sample_rate: Sample rate of audio_data in Hz (default: from config)
 
         Returns:
             True if encoding was successful, False otherwise
@@ -54,26 +360,38 @@ class MP3Encoder:
         Raises:
             MP3EncoderError: If encoding fails
         """
-        try:
-            logger.info(f"Starting MP3 encoding to {output_file}")
+        blocks = (
+            audio_data[start:start + ENCODE_CHUNK_FRAMES]
+            for start in range(0, len(audio_data), ENCODE_CHUNK_FRAMES)
+        )
+        channels = 1 if audio_data.ndim == 1 else audio_data.shape[1]
+        return self.encode_pcm_stream(blocks, output_file, sample_rate, channels)
 
-            # Create encoder
-            encoder = lameenc.Encoder()
-            encoder.set_bit_rate(self.bitrate)
-            encoder.set_in_sample_rate(SAMPLE_RATE)
-            encoder.set_channels(CHANNELS)
-            encoder.set_quality(self.quality)
+    def encode_pcm_stream(self, frames: Iterable[np.ndarray], output_file: str,
+                          sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS) -> bool:
+        """
+        Encode a stream of audio blocks to MP3 format.
 
-            # Convert float32 audio to int16 PCM
-            pcm_data = (audio_data * 32767).astype(np.int16).tobytes()
+        Blocks are encoded as they arrive, so the caller never needs to hold
+        the whole recording in one contiguous array.
 
-            # Encode to MP3
-            mp3_data = encoder.encode(pcm_data)
-            mp3_data += encoder.flush()
+        Args:
+            frames: Iterable of audio blocks, float32 (range -1.0 to 1.0) or
+                int16, shape (samples,) for mono or (samples, channels)
+            output_file: Path to output MP3 file
+            sample_rate: Sample rate of the blocks in Hz (default: from config)
+            channels: Number of channels in the blocks (default: from config)
 
-            # Write to file
-            with open(output_file, "wb") as f:
-                f.write(mp3_data)
+        Returns:
+            True if encoding was successful, False otherwise
+
+        Raises:
+            MP3EncoderError: If encoding fails
+        """
+        try:
+            logger.info(f"Starting MP3 encoding to {output_file}")
+
+            self._encode_blocks(frames, output_file, sample_rate, channels)
 
             file_size_mb = os.path.getsize(output_file) / (1024 * 1024)
             logger.info(f"MP3 encoding successful. File size: {file_size_mb:.2f} MB")
@@ -88,6 +406,10 @@ class MP3Encoder:
         """
         Convert a WAV file to MP3.
 
+        The WAV file is read in blocks by a background thread while the
+        previous blocks are encoded and written, so the whole file is never
+        loaded into memory and reading, encoding and writing overlap.
+
         Args:
             wav_file: Path to input WAV file
             mp3_file: Path to output MP3 file
@@ -102,24 +424,29 @@ class MP3Encoder:
         try:
             import soundfile as sf
 
-            # Read WAV file
-            audio_data, sample_rate = sf.read(wav_file, dtype='float32')
+            logger.info(f"Converting {wav_file} to {mp3_file}")
 
-            if sample_rate != SAMPLE_RATE:
-                logger.warning(f"Sample rate mismatch: {sample_rate} != {SAMPLE_RATE}")
+            with sf.SoundFile(wav_file) as wav:
+                wav_blocks = wav.blocks(blocksize=ENCODE_CHUNK_FRAMES, dtype='float32',
+                                        always_2d=True)
+                # closing() stops the reader thread before the WAV is closed
+                with contextlib.closing(_read_ahead(wav_blocks)) as blocks:
+                    self._encode_blocks(blocks, mp3_file, wav.samplerate, wav.channels)
 
-            # Encode to MP3
-            success = self.encode(audio_data, mp3_file)
+            file_size_mb = os.path.getsize(mp3_file) / (1024 * 1024)
+            logger.info(f"MP3 encoding successful. File size: {file_size_mb:.2f} MB")
 
-            # Delete WAV file if requested and encoding was successful
-            if success and delete_wav and os.path.exists(wav_file):
+            # Delete WAV file if requested (encoding was successful)
+            if delete_wav:
                 try:
                     os.remove(wav_file)
                     logger.info(f"Deleted temporary WAV file: {wav_file}")
-                except Exception as e:
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
                     logger.warning(f"Failed to delete WAV file: {e}")
 
-            return success
+            return True
 
         except Exception as e:
             logger.error(f"WAV to MP3 conversion failed: {e}")
@@ -3,27 +3,128 @@ GUI for the Audio Recorder application with modern design using ttkbootstrap.
 """
 
 import os
+import json
+import time
+import queue
 import logging
-import datetime
-from tkinter import messagebox, filedialog
-from threading import Thread
-from typing import Optional
+from datetime import datetime as _dt, timedelta
+from os.path import join as _pjoin
+from tkinter import messagebox, filedialog, EventType, TclError
+from tkinter import font as tkfont
+from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, List, TYPE_CHECKING
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 
 from config import (
     WINDOW_TITLE, WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_RESIZABLE, GUI_THEME,
-    DEFAULT_TIMER_MINUTES, TIMER_DISPLAY_INTERVAL_MS,
-    MP3_BITRATE_OPTIONS, DEFAULT_MP3_BITRATE,
-    OUTPUT_FOLDER, OUTPUT_FILE_PREFIX, TIMESTAMP_FORMAT
+    DEFAULT_TIMER_MINUTES, TIMER_DISPLAY_INTERVAL_MS, TICK_ALIGN_SLACK_MS,
+    DEVICE_CACHE_TTL_S, LEVEL_FPS, WORKER_THREADS,
+    QUALITY_DISPLAY_OPTIONS, QUALITY_BITRATES, DEFAULT_MP3_BITRATE,
+    OUTPUT_FOLDER, OUTPUT_FILE_PREFIX, TIMESTAMP_FORMAT, STATE_FILE,
+    FOLDER_CHECK_TIMEOUT_S
 )
-from recorder import AudioRecorder, AudioRecorderError
-from encoder import MP3Encoder, MP3EncoderError
+
+if TYPE_CHECKING:
+    from encoder import MP3Encoder
+    from recorder import AudioRecorder
 
 
 logger = logging.getLogger(__name__)
 
+# The display shows whole seconds, so faster ticks cannot show anything new
+_TICK_INTERVAL_MS = max(TIMER_DISPLAY_INTERVAL_MS, 500)
+
+# Enumerated audio devices, shared across GUI instances (WASAPI queries are slow)
+_DEVICE_CACHE: List[dict] = []
+_DEVICE_CACHE_TS: Optional[float] = None  # time.monotonic() of the last enumeration
+
+
+def _get_audio_devices_cached(force: bool = False) -> List[dict]:
+    """
+    Get audio devices, re-enumerating only when the cache is stale.
+
+    Args:
+        force: Enumerate devices even if the cached list is still fresh
+
+    Returns:
+        List of device info dictionaries (see AudioRecorder.get_audio_devices)
+    """
+    global _DEVICE_CACHE, _DEVICE_CACHE_TS
+
+    # Imported here so NumPy and PyAudio load after the window is shown
+    from recorder import AudioRecorder
+
+    cache_fresh = (
+        _DEVICE_CACHE_TS is not None
+        and time.monotonic() - _DEVICE_CACHE_TS < DEVICE_CACHE_TTL_S
+    )
+    if force or not cache_fresh:
+        _DEVICE_CACHE = AudioRecorder.get_audio_devices()
+        _DEVICE_CACHE_TS = time.monotonic()
+    else:
+        logger.debug("Using cached audio device list")
+
+    return _DEVICE_CACHE
+
+
+def _load_state() -> dict:
+    """
+    Load the settings remembered from the last session.
+
+    Returns:
+        State dictionary, empty if there is no usable state file
+    """
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read state file: {e}")
+        return {}
+
+    return state if isinstance(state, dict) else {}
+
+
+def _save_state(state: dict) -> None:
+    """
+    Remember settings for the next session.
+
+    Args:
+        state: State dictionary to write
+    """
+    try:
+        with open(STATE_FILE, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+    except OSError as e:
+        logger.warning(f"Could not write state file: {e}")
+
+
+def _is_dir_responsive(path: str, timeout: float = FOLDER_CHECK_TIMEOUT_S) -> bool:
+    """
+    Check in a helper thread whether a folder exists, giving up after a timeout.
+
+    A folder on a disconnected network share can block stat() for seconds;
+    the check is abandoned instead of freezing the UI.
+
+    Args:
+        path: Folder to check
+        timeout: Seconds to wait for the check
+
+    Returns:
+        True if the folder exists and answered in time
+    """
+    result = queue.Queue(maxsize=1)
+    Thread(target=lambda: result.put(os.path.isdir(path)), daemon=True).start()
+    try:
+        return result.get(timeout=timeout)
+    except queue.Empty:
+        logger.warning(f"Folder check timed out: {path}")
+        return False
+
 
 class AudioRecorderGUI:
     """
@@ -38,18 +139,42 @@ class AudioRecorderGUI:
             root: ttkbootstrap Window
         """
         self.root = root
-        self.recorder = AudioRecorder()
-        self.encoder: Optional[MP3Encoder] = None
+        self.recorder: Optional["AudioRecorder"] = None  # Created on first recording
+        self.encoder: Optional["MP3Encoder"] = None
         self.available_devices = []  # List of available audio devices
+        self._device_by_index = {}  # Combo box position -> device info
+        self._default_index = 0  # Combo box position of the default loopback device
 
         # State variables
         self.is_recording = False
         self.is_paused = False
         self.start_time = 0.0
         self.elapsed_time = 0.0
-        self.output_path = OUTPUT_FOLDER
-        self.timer_end_time = None  # Calculated end time for timer
-        self.timer_stop_scheduled = None  # ID for scheduled timer stop
+        self.output_path = _load_state().get("output_path", OUTPUT_FOLDER)
+        self.timer_end_time = None  # Calculated end time for timer (wall clock, for display)
+        self._timer_deadline_monotonic = None  # Timer end on the monotonic clock
+        self._stop_after_id = None  # ID for scheduled timer stop
+        self._level_band = "success"  # Current color band of the level meter
+        self._level_value = 0  # Value currently shown by the level meter (0-100)
+        self._level_styles = {}  # ttk style name of the level meter per color band
+        self._tick_id = None  # ID of the scheduled UI tick while recording
+        self._level_latest = 0.0  # Latest level pushed by the recorder
+        self._level_tick_pending = False  # A <<LevelTick>> is queued and not yet handled
+        self._level_lock = Lock()  # Guards _level_latest and _level_tick_pending
+        self._visible = True  # False while the window is minimized
+        self._level_interval_s = 1.0 / LEVEL_FPS  # Seconds between level meter updates
+        self._widget_options = {}  # Last options set per widget, to skip redundant updates
+        self._last_elapsed_sec = None  # Last whole second shown in the elapsed time
+        self._last_remaining_sec = None  # Last whole second shown in the countdown
+        self._recording_timestamp = ""  # Start time of the recording, used in file names
+        self._selected_bitrate = DEFAULT_MP3_BITRATE  # Parsed on quality change
+        self._selected_device: Optional[dict] = None  # Resolved on device change
+        self._pending_msg = {}  # Payloads from worker threads, keyed by event name
+        self._pending_lock = Lock()  # Guards _pending_msg
+        # Long-lived worker threads, instead of a new thread per operation
+        self._executor = ThreadPoolExecutor(max_workers=WORKER_THREADS,
+                                            thread_name_prefix="musik-snip")
+        self._closing = False  # Set by shutdown(); workers then stop posting to Tk
 
         # Setup window
         self.setup_window()
@@ -57,6 +182,29 @@ class AudioRecorderGUI:
         # Create GUI elements
         self.create_widgets()
 
+        # Level updates are pushed from the recording thread
+        self.root.bind("<<LevelTick>>", self.update_audio_level)
+
+        # Track whether the window is shown, so the meter is not redrawn while minimized
+        self.root.bind("<Map>", self._on_visibility_change, add="+")
+        self.root.bind("<Unmap>", self._on_visibility_change, add="+")
+
+        # Worker threads report back through virtual events instead of
+        # calling Tk from outside the UI thread
+        self.root.bind("<<DevicesLoaded>>",
+                       lambda e: self._apply_device_list(self._take_pending("DevicesLoaded")))
+        self.root.bind("<<DeviceLoadError>>",
+                       lambda e: self._on_device_load_error(self._take_pending("DeviceLoadError")))
+        self.root.bind("<<RecordingDone>>", lambda e: self.stop_recording())
+        self.root.bind("<<RecordingError>>",
+                       lambda e: self.on_recording_error(self._take_pending("RecordingError")))
+        self.root.bind("<<SaveSuccess>>",
+                       lambda e: self.on_save_success(self._take_pending("SaveSuccess")))
+        self.root.bind("<<SaveError>>",
+                       lambda e: self.on_save_error(self._take_pending("SaveError")))
+        self.root.bind("<<FolderChecked>>",
+                       lambda e: self._ask_output_folder(self._take_pending("FolderChecked")))
+
         # Load audio devices
         self.load_audio_devices()
 
@@ -71,6 +219,14 @@ class AudioRecorderGUI:
     def create_widgets(self) -> None:
         """Create all GUI widgets with modern design."""
 
+        # Shared fonts, created once instead of one per widget
+        self._f_title = tkfont.Font(family="Segoe UI", size=16, weight="bold")
+        self._f_status = tkfont.Font(family="Segoe UI", size=12)
+        self._f_countdown = tkfont.Font(family="Segoe UI", size=11)
+        self._f_body = tkfont.Font(family="Segoe UI", size=10)
+        self._f_bold10 = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+        self._f_small = tkfont.Font(family="Segoe UI", size=9)
+
         # Main container with padding
         main_frame = ttk.Frame(self.root, padding=10)
         main_frame.pack(fill=BOTH, expand=YES)
@@ -79,7 +235,7 @@ class AudioRecorderGUI:
         title_label = ttk.Label(
             main_frame,
             text="System Audio Recorder",
-            font=("Segoe UI", 16, "bold"),
+            font=self._f_title,
             bootstyle="inverse-dark"
         )
         title_label.pack(pady=(0, 10))
@@ -98,10 +254,20 @@ class AudioRecorderGUI:
             device_frame,
             textvariable=self.device_var,
             state="readonly",
-            font=("Segoe UI", 10),
+            font=self._f_body,
             bootstyle="primary"
         )
-        self.device_combo.pack(fill=X)
+
+        self.refresh_button = ttk.Button(
+            device_frame,
+            text="🔄",
+            command=self.refresh_devices,
+            bootstyle="outline-primary",
+            width=3
+        )
+        self.refresh_button.pack(side=RIGHT, padx=(5, 0))
+        self.device_combo.pack(side=LEFT, fill=X, expand=YES)
+        self.device_combo.bind("<<ComboboxSelected>>", self._on_device_change)
 
         # Settings frame
         settings_frame = ttk.Labelframe(
@@ -119,7 +285,7 @@ class AudioRecorderGUI:
         ttk.Label(
             timer_frame,
             text="⏱️ Timer:",
-            font=("Segoe UI", 10, "bold")
+            font=self._f_bold10
         ).pack(side=LEFT, padx=(0, 10))
 
         # Minutes spinbox
@@ -129,7 +295,7 @@ class AudioRecorderGUI:
             from_=0,
             to=999,
             width=5,
-            font=("Segoe UI", 10),
+            font=self._f_body,
             bootstyle="secondary"
         )
         self.timer_minutes.set(DEFAULT_TIMER_MINUTES)
@@ -142,7 +308,7 @@ class AudioRecorderGUI:
             from_=0,
             to=59,
             width=5,
-            font=("Segoe UI", 10),
+            font=self._f_body,
             bootstyle="secondary"
         )
         self.timer_seconds.set(0)
@@ -163,7 +329,7 @@ class AudioRecorderGUI:
         self.timer_end_label = ttk.Label(
             settings_frame,
             text="",
-            font=("Segoe UI", 9),
+            font=self._f_small,
             bootstyle="info"
         )
         self.timer_end_label.pack(fill=X, pady=(0, 5))
@@ -175,26 +341,22 @@ class AudioRecorderGUI:
         ttk.Label(
             quality_frame,
             text="🎵 MP3-Qualität:",
-            font=("Segoe UI", 10, "bold")
+            font=self._f_bold10
         ).pack(side=LEFT, padx=(0, 10))
 
-        # Create quality options with bitrate
-        quality_options = [
-            f"{name} ({bitrate} kbps)"
-            for name, bitrate in MP3_BITRATE_OPTIONS.items()
-        ]
-
+        # Quality options with bitrate (precomputed in config)
         self.quality_var = ttk.StringVar(value=f"Medium ({DEFAULT_MP3_BITRATE} kbps)")
-        quality_combo = ttk.Combobox(
+        self.quality_combo = ttk.Combobox(
             quality_frame,
             textvariable=self.quality_var,
-            values=quality_options,
+            values=QUALITY_DISPLAY_OPTIONS,
             state="readonly",
             width=20,
-            font=("Segoe UI", 10),
+            font=self._f_body,
             bootstyle="secondary"
         )
-        quality_combo.pack(side=LEFT)
+        self.quality_combo.pack(side=LEFT)
+        self.quality_combo.bind("<<ComboboxSelected>>", self._on_quality_change)
 
         # Output folder selection
         folder_frame = ttk.Frame(settings_frame)
@@ -203,24 +365,25 @@ class AudioRecorderGUI:
         ttk.Label(
             folder_frame,
             text="📁 Speicherort:",
-            font=("Segoe UI", 10, "bold")
+            font=self._f_bold10
         ).pack(side=LEFT, padx=(0, 10))
 
         self.folder_label = ttk.Label(
             folder_frame,
-            text=OUTPUT_FOLDER,
-            font=("Segoe UI", 9),
+            text=self.output_path,
+            font=self._f_small,
             bootstyle="primary"
         )
         self.folder_label.pack(side=LEFT, fill=X, expand=YES, padx=(0, 10))
 
-        ttk.Button(
+        self.folder_button = ttk.Button(
             folder_frame,
             text="Ändern",
             command=self.choose_output_folder,
             bootstyle="outline-secondary",
             width=10
-        ).pack(side=RIGHT)
+        )
+        self.folder_button.pack(side=RIGHT)
 
         # Status display with modern card design
         status_frame = ttk.Frame(main_frame)
@@ -233,12 +396,21 @@ class AudioRecorderGUI:
         self.status_label = ttk.Label(
             status_card,
             text="⚫ Bereit",
-            font=("Segoe UI", 12),
+            font=self._f_status,
             bootstyle="inverse-dark",
             padding=10
         )
         self.status_label.pack(fill=X)
 
+        # Result of the last save (shown inline instead of a modal dialog)
+        self.save_info_label = ttk.Label(
+            status_frame,
+            text="",
+            font=self._f_small,
+            bootstyle="success"
+        )
+        self.save_info_label.pack(fill=X)
+
         # Time displays in a frame
         time_display_frame = ttk.Frame(main_frame)
         time_display_frame.pack(fill=X, pady=(0, 5))
@@ -247,7 +419,7 @@ class AudioRecorderGUI:
         self.time_label = ttk.Label(
             time_display_frame,
             text="Laufzeit: 00:00",
-            font=("Segoe UI", 16, "bold"),
+            font=self._f_title,
             bootstyle="info"
         )
         self.time_label.pack()
@@ -256,7 +428,7 @@ class AudioRecorderGUI:
         self.countdown_label = ttk.Label(
             time_display_frame,
             text="",
-            font=("Segoe UI", 11),
+            font=self._f_countdown,
             bootstyle="warning"
         )
         self.countdown_label.pack()
@@ -278,6 +450,12 @@ class AudioRecorderGUI:
         )
         self.level_meter.pack(fill=X)
 
+        # Build the striped styles for every band once, so switching bands
+        # while recording is a plain ttk style swap
+        for band in ("danger", "warning", "success"):
+            self.level_meter.configure(bootstyle=f"{band}-striped")
+            self._level_styles[band] = self.level_meter.cget("style")
+
         # Control buttons with modern styling
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(pady=8, fill=X)
@@ -315,6 +493,45 @@ class AudioRecorderGUI:
         )
         self.stop_button.pack(side=LEFT, padx=5)
 
+        # Give the control buttons one shared font through derived ttk styles
+        # ("Rec.success.TButton" inherits colors from "success.TButton")
+        style = ttk.Style()
+        for button in (self.start_button, self.pause_button, self.stop_button):
+            rec_style = f"Rec.{button.cget('style')}"
+            style.configure(rec_style, font=self._f_bold10)
+            button.configure(style=rec_style)
+
+        self._build_ui_profiles()
+
+    def _build_ui_profiles(self) -> None:
+        """Precompute the widget settings for the idle, recording and saving states."""
+        # Timer controls stay enabled during recording for dynamic adjustment
+        self._ui_profile_recording = [
+            (self.status_label, dict(text="🔴 Nehme auf...", bootstyle="danger")),
+            (self.save_info_label, dict(text="")),
+            (self.start_button, dict(state=DISABLED)),
+            (self.pause_button, dict(state=NORMAL)),
+            (self.stop_button, dict(state=NORMAL)),
+            (self.device_combo, dict(state=DISABLED)),
+            (self.refresh_button, dict(state=DISABLED)),
+        ]
+        self._ui_profile_saving = [
+            (self.status_label, dict(text="💾 Speichere...", bootstyle="info")),
+            (self.pause_button, dict(state=DISABLED)),
+            (self.stop_button, dict(state=DISABLED)),
+        ]
+        self._ui_profile_idle = [
+            (self.status_label, dict(text="⚫ Bereit", bootstyle="dark")),
+            (self.start_button, dict(state=NORMAL)),
+            (self.pause_button, dict(text="⏸️ Pause", state=DISABLED)),
+            (self.stop_button, dict(state=DISABLED)),
+            (self.device_combo, dict(state="readonly")),
+            (self.refresh_button, dict(state=NORMAL)),
+            (self.timer_minutes, dict(state=NORMAL)),
+            (self.timer_seconds, dict(state=NORMAL)),
+            (self.timer_button, dict(state=NORMAL)),
+        ]
+
     def on_timer_toggle(self) -> None:
         """Called when timer checkbox is toggled."""
         if self.timer_enabled.get():
@@ -329,7 +546,7 @@ class AudioRecorderGUI:
 
                     if total_seconds > 0:
                         # Set new end time from now
-                        self.timer_end_time = datetime.datetime.now() + datetime.timedelta(seconds=total_seconds)
+                        self._set_timer_deadline(total_seconds)
                         logger.info(f"Timer activated during recording: {total_seconds}s from now")
                         self.schedule_timer_stop(total_seconds)
                 except ValueError:
@@ -337,13 +554,27 @@ class AudioRecorderGUI:
         else:
             self.timer_end_label.config(text="")
             self.timer_end_time = None
+            self._timer_deadline_monotonic = None
 
             # If recording is active and timer was disabled, cancel scheduled stop
-            if self.is_recording and self.timer_stop_scheduled:
-                self.root.after_cancel(self.timer_stop_scheduled)
-                self.timer_stop_scheduled = None
+            if self.is_recording and self._stop_after_id:
+                self.root.after_cancel(self._stop_after_id)
+                self._stop_after_id = None
                 logger.info("Timer disabled during recording - cancelled scheduled stop")
 
+    def _set_timer_deadline(self, total_seconds: float) -> None:
+        """
+        Set the timer deadline relative to now.
+
+        The countdown runs on the monotonic clock so wall-clock jumps cannot
+        break it; the datetime is only kept for the end-time label.
+
+        Args:
+            total_seconds: Seconds from now until the timer ends
+        """
+        self._timer_deadline_monotonic = time.monotonic() + total_seconds
+        self.timer_end_time = _dt.now() + timedelta(seconds=total_seconds)
+
     def schedule_timer_stop(self, seconds: float) -> None:
         """
         Schedule automatic stop after specified seconds.
@@ -352,12 +583,12 @@ class AudioRecorderGUI:
             seconds: Seconds from now when to stop recording
         """
         # Cancel any previously scheduled stop
-        if self.timer_stop_scheduled:
-            self.root.after_cancel(self.timer_stop_scheduled)
+        if self._stop_after_id:
+            self.root.after_cancel(self._stop_after_id)
 
         # Schedule new stop
         milliseconds = int(seconds * 1000)
-        self.timer_stop_scheduled = self.root.after(milliseconds, self.stop_recording)
+        self._stop_after_id = self.root.after(milliseconds, self.stop_recording)
         logger.info(f"Scheduled recording stop in {seconds}s")
 
     def update_timer_end_display(self) -> None:
@@ -371,7 +602,7 @@ class AudioRecorderGUI:
             total_seconds = minutes * 60 + seconds
 
             if total_seconds > 0:
-                end_time = datetime.datetime.now() + datetime.timedelta(seconds=total_seconds)
+                end_time = _dt.now() + timedelta(seconds=total_seconds)
                 self.timer_end_time = end_time
                 self.timer_end_label.config(
                     text=f"⏰ Timer endet um: {end_time.strftime('%H:%M:%S')}"
@@ -383,53 +614,171 @@ class AudioRecorderGUI:
             self.timer_end_label.config(text="⚠️ Ungültige Timer-Eingabe")
             self.timer_end_time = None
 
-    def load_audio_devices(self) -> None:
-        """Load available audio devices into combo box."""
+    def load_audio_devices(self, force: bool = False) -> None:
+        """
+        Load available audio devices into combo box.
+
+        Enumeration runs in a background thread so the window is not blocked;
+        the combo box shows a placeholder until the list arrives. Device
+        enumeration is slow on WASAPI, so the last result is reused for
+        DEVICE_CACHE_TTL_S seconds unless a refresh is requested.
+
+        Args:
+            force: Enumerate devices even if the cached list is still fresh
+        """
+        self._configure_changed(self.device_combo, values=("Lade Geräte…",), state=DISABLED)
+        self.device_combo.current(0)
+        self._configure_changed(self.refresh_button, state=DISABLED)
+
+        self._submit(self._enumerate_devices_bg, force)
+
+    def _enumerate_devices_bg(self, force: bool) -> None:
+        """
+        Enumerate audio devices off the UI thread and hand the result back.
+
+        Args:
+            force: Enumerate devices even if the cached list is still fresh
+        """
         try:
-            self.available_devices = AudioRecorder.get_audio_devices()
+            devices = _get_audio_devices_cached(force)
+        except Exception as e:
+            logger.error(f"Failed to load audio devices: {e}")
+            self._post("DeviceLoadError", str(e))
+            return
 
-            if not self.available_devices:
-                self.device_combo['values'] = ["Standard (System Loopback)"]
-                self.device_combo.current(0)
-                logger.warning("No audio devices found, using default")
-                return
+        self._post("DevicesLoaded", devices)
 
-            # Create display names with loopback indicator
-            device_names = []
-            default_index = 0
+    def _apply_device_list(self, devices: List[dict]) -> None:
+        """
+        Fill the device combo box (runs on the UI thread).
 
-            for i, d in enumerate(self.available_devices):
-                loopback_tag = " [Loopback]" if d.get('is_loopback') else " [Mikrofon]"
-                default_tag = " ⭐" if d.get('is_default') else ""
-                name = f"{d['name']}{loopback_tag}{default_tag}"
-                device_names.append(name)
+        Args:
+            devices: Device info dictionaries from AudioRecorder.get_audio_devices
+        """
+        self.available_devices = devices
+        self._device_by_index = dict(enumerate(devices))
+        self._default_index = next(
+            (i for i, d in enumerate(devices) if d.get('is_default')), 0
+        )
 
-                # Set default loopback as default selection
-                if d.get('is_default'):
-                    default_index = i
+        if not self.is_recording:
+            self._configure_changed(self.device_combo, state="readonly")
+            self._configure_changed(self.refresh_button, state=NORMAL)
+
+        if not self.available_devices:
+            self._configure_changed(self.device_combo, values=("Standard (System Loopback)",))
+            self.device_combo.current(0)
+            self._selected_device = None
+            logger.warning("No audio devices found, using default")
+            return
 
-            self.device_combo['values'] = device_names
-            self.device_combo.current(default_index)
+        # Create display names with loopback indicator
+        device_names = tuple(
+            f"{d['name']}{' [Loopback]' if d.get('is_loopback') else ' [Mikrofon]'}"
+            f"{' ⭐' if d.get('is_default') else ''}"
+            for d in self.available_devices
+        )
 
-            loopback_count = sum(1 for d in self.available_devices if d.get('is_loopback'))
-            logger.info(f"Loaded {len(self.available_devices)} audio devices ({loopback_count} loopback)")
+        # Keep the current selection if the device is still present,
+        # otherwise select the default loopback device
+        default_index = self._default_index
+        if self._selected_device is not None:
+            selected_id = self._selected_device['id']
+            default_index = next(
+                (i for i, d in enumerate(self.available_devices) if d['id'] == selected_id),
+                default_index
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to load audio devices: {e}")
-            messagebox.showerror("Fehler", f"Fehler beim Laden der Audio-Geräte:\n{e}")
+        self._configure_changed(self.device_combo, values=device_names)
+        self.device_combo.current(default_index)
+        self._on_device_change()
+
+        loopback_count = sum(1 for d in self.available_devices if d.get('is_loopback'))
+        logger.info(f"Loaded {len(self.available_devices)} audio devices ({loopback_count} loopback)")
+
+    def _on_device_load_error(self, error_msg: str) -> None:
+        """
+        Handle a failed device enumeration.
+
+        Args:
+            error_msg: Error message
+        """
+        self._apply_device_list([])
+        messagebox.showerror("Fehler", f"Fehler beim Laden der Audio-Geräte:\n{error_msg}")
+
+    def refresh_devices(self) -> None:
+        """Re-enumerate audio devices, bypassing the device cache."""
+        logger.info("Refreshing audio device list")
+        self.load_audio_devices(force=True)
 
     def choose_output_folder(self) -> None:
-        """Open dialog to choose output folder."""
+        """
+        Open dialog to choose output folder.
+
+        The current folder is checked on a worker thread first, since a
+        missing network drive can take a long time to answer; the dialog
+        itself then opens on the UI thread.
+        """
+        self.folder_button.configure(state=DISABLED)
+        current = self.output_path
+
+        def check_folder():
+            # Fall back to the home folder if the current one is missing or hangs
+            initial_dir = current if _is_dir_responsive(current) else os.path.expanduser("~")
+            self._post("FolderChecked", initial_dir)
+
+        self._submit(check_folder)
+
+    def _ask_output_folder(self, initial_dir: str) -> None:
+        """
+        Show the folder dialog and apply the choice (runs on the UI thread).
+
+        Args:
+            initial_dir: Folder the dialog starts in
+        """
         folder = filedialog.askdirectory(
+            parent=self.root,
             title="Speicherort wählen",
-            initialdir=self.output_path
+            initialdir=initial_dir
         )
+        self._apply_output_folder(folder)
+
+    def _apply_output_folder(self, folder: str) -> None:
+        """
+        Use a folder chosen in the folder dialog.
+
+        Args:
+            folder: Chosen folder, or an empty string if cancelled
+        """
+        self.folder_button.configure(state=NORMAL)
 
         if folder:
             self.output_path = folder
             self.folder_label.config(text=folder)
+            state = _load_state()
+            state["output_path"] = folder
+            _save_state(state)
             logger.info(f"Output folder changed to: {folder}")
 
+    def _on_device_change(self, event=None) -> None:
+        """Resolve and cache the device info when the device selection changes."""
+        device = self._device_by_index.get(self.device_combo.current())
+
+        if device is None:
+            logger.warning("Invalid device selection, using default")
+        else:
+            logger.info(f"Selected device: {device['name']} (loopback={device.get('is_loopback')})")
+
+        self._selected_device = device
+
+    def _on_quality_change(self, event=None) -> None:
+        """Cache the bitrate for the selected quality entry."""
+        index = self.quality_combo.current()
+        if 0 <= index < len(QUALITY_BITRATES):
+            self._selected_bitrate = QUALITY_BITRATES[index]
+        else:
+            self._selected_bitrate = DEFAULT_MP3_BITRATE
+
     def get_selected_device(self) -> Optional[dict]:
         """
         Get the selected audio device info.
@@ -437,48 +786,65 @@ class AudioRecorderGUI:
         Returns:
             Device info dict or None for default device
         """
-        try:
-            selected_index = self.device_combo.current()
+        return self._selected_device
 
-            if selected_index < 0 or selected_index >= len(self.available_devices):
-                logger.warning("Invalid device selection, using default")
-                return None
+    def get_selected_bitrate(self) -> int:
+        """
+        Get the bitrate of the quality selection.
 
-            device = self.available_devices[selected_index]
-            logger.info(f"Selected device: {device['name']} (loopback={device.get('is_loopback')})")
-            return device
+        Returns:
+            Bitrate in kbps
+        """
+        return self._selected_bitrate
 
-        except (IndexError, AttributeError) as e:
-            logger.warning(f"Could not get selected device: {e}, using default")
-            return None
+    def _ensure_recorder(self) -> "AudioRecorder":
+        """
+        Get the audio recorder, creating it on first use.
 
-    def get_selected_bitrate(self) -> int:
+        Returns:
+            The AudioRecorder shared by all recordings
+        """
+        # Imported here so the audio stack does not delay start-up
+        from recorder import AudioRecorder
+
+        if self.recorder is None:
+            self.recorder = AudioRecorder()
+            self.recorder.level_interval = self._level_interval_s
+        return self.recorder
+
+    def _ensure_encoder(self) -> "MP3Encoder":
         """
-        Extract bitrate from quality selection.
+        Get the MP3 encoder for the selected bitrate, reusing the current one.
 
         Returns:
-            Bitrate in kbps
+            MP3Encoder configured with the selected bitrate
         """
-        selection = self.quality_var.get()  # e.g. "Medium (192 kbps)"
-        try:
-            # Extract number between parentheses
-            bitrate_str = selection.split("(")[1].split(" ")[0]
-            return int(bitrate_str)
-        except (IndexError, ValueError):
-            logger.warning(f"Could not parse bitrate from {selection}, using default")
-            return DEFAULT_MP3_BITRATE
+        # Imported here so the encoder stack does not delay start-up
+        from encoder import MP3Encoder
+
+        bitrate = self.get_selected_bitrate()
+        if self.encoder is None or self.encoder.bitrate != bitrate:
+            self.encoder = MP3Encoder(bitrate=bitrate)
+        return self.encoder
+
+    def _release_encoder(self) -> None:
+        """Free the MP3 encoder and its buffers once a save has finished."""
+        if self.encoder is not None:
+            self.encoder.close()
+            self.encoder = None
 
     def start_recording(self) -> None:
         """Start audio recording."""
         if self.is_recording:
             return
 
+        reserved = False
         try:
             # Get selected device
             device_info = self.get_selected_device()
 
-            # Create new recorder with selected device
-            self.recorder = AudioRecorder(device=device_info)
+            # Reuse the recorder, only switching its device
+            self._ensure_recorder().set_device(device_info)
 
             # Get timer duration
             duration = None
@@ -497,7 +863,7 @@ class AudioRecorderGUI:
 
                     duration = total_seconds
                     # Calculate end time
-                    self.timer_end_time = datetime.datetime.now() + datetime.timedelta(seconds=duration)
+                    self._set_timer_deadline(duration)
 
                 except ValueError:
                     messagebox.showerror(
@@ -506,47 +872,61 @@ class AudioRecorderGUI:
                     )
                     return
 
+            # Reserve the recorder before the UI shows "recording", so a Stop
+            # that arrives before the worker starts is not lost
+            self.recorder.begin_recording()
+            reserved = True
+
             # Update UI
             self.is_recording = True
             self.is_paused = False
+            self._recording_timestamp = _dt.now().strftime(TIMESTAMP_FORMAT)
             self.start_time = 0.0
             self.elapsed_time = 0.0
 
-            self.status_label.config(text="🔴 Nehme auf...", bootstyle="danger")
-            self.start_button.config(state=DISABLED)
-            self.pause_button.config(state=NORMAL)
-            self.stop_button.config(state=NORMAL)
-            self.device_combo.config(state=DISABLED)
-            # Keep timer controls enabled during recording for dynamic adjustment
-            # self.timer_minutes.config(state=DISABLED)
-            # self.timer_seconds.config(state=DISABLED)
-            # self.timer_button.config(state=DISABLED)
+            self._apply_profile(self._ui_profile_recording)
 
             logger.info(f"Starting recording (duration={duration})")
 
+            from recorder import AudioRecorderError
+
+            # Set up the MP3 encoder alongside, so saving does not pay for it
+            # later and the recording does not wait for it
+            sample_rate, channels = self.recorder.sample_rate, self.recorder.channels
+
+            def prepare_encoder():
+                try:
+                    self._ensure_encoder().prepare(sample_rate, channels)
+                except Exception as e:
+                    logger.warning(f"Could not prepare MP3 encoder: {e}")
+
             # Start recording in separate thread
             def record_thread():
                 try:
                     self.recorder.start_recording(
                         duration=duration,
-                        callback=self.on_recording_progress
+                        callback=self.on_recording_progress,
+                        level_callback=self._push_level
                     )
                     # Recording finished normally (timer expired)
                     if self.is_recording:
-                        self.root.after(0, self.stop_recording)
+                        self._post("RecordingDone")
                 except AudioRecorderError as e:
                     logger.error(f"Recording error: {e}")
-                    error_msg = str(e)
-                    self.root.after(0, lambda msg=error_msg: self.on_recording_error(msg))
+                    self._post("RecordingError", str(e))
 
-            Thread(target=record_thread, daemon=True).start()
+            self._submit(record_thread)
+            self._submit(prepare_encoder)
 
             # Start UI updates
-            self.update_display()
-            self.update_audio_level()
+            self._start_ticker()
 
         except Exception as e:
             logger.error(f"Failed to start recording: {e}")
+            if reserved:
+                # Release the reservation; a start that was already submitted
+                # sees the stop and does nothing
+                self.recorder.stop_recording()
             messagebox.showerror("Fehler", f"Aufnahme konnte nicht gestartet werden:\n{e}")
             self.reset_ui()
 
@@ -559,15 +939,16 @@ class AudioRecorderGUI:
             # Resume
             self.recorder.resume_recording()
             self.is_paused = False
-            self.pause_button.config(text="⏸️ Pause")
-            self.status_label.config(text="🔴 Nehme auf...", bootstyle="danger")
+            self._configure_changed(self.pause_button, text="⏸️ Pause")
+            self._set_status("🔴 Nehme auf...", "danger")
             logger.info("Recording resumed")
         else:
             # Pause
             self.recorder.pause_recording()
             self.is_paused = True
-            self.pause_button.config(text="▶️ Fortsetzen")
-            self.status_label.config(text="⏸️ Pausiert", bootstyle="warning")
+            self._configure_changed(self.pause_button, text="▶️ Fortsetzen")
+            self._set_status("⏸️ Pausiert", "warning")
+            self.update_audio_level()
             logger.info("Recording paused")
 
     def stop_recording(self) -> None:
@@ -582,46 +963,47 @@ class AudioRecorderGUI:
             self.is_paused = False
 
             # Update UI
-            self.status_label.config(text="💾 Speichere...", bootstyle="info")
-            self.pause_button.config(state=DISABLED)
-            self.stop_button.config(state=DISABLED)
+            self._stop_ticker()
+            self._apply_profile(self._ui_profile_saving)
 
-            # Save and encode in separate thread
+            timestamp = self._recording_timestamp
+
+            # Encode in separate thread straight from the recorded buffer,
+            # without a temporary WAV round-trip
             def save_thread():
+                # Imported here so the encoder stack does not delay start-up
+                from encoder import MP3EncoderError
+                from recorder import AudioRecorderError
+
                 try:
-                    # Generate filename
-                    timestamp = datetime.datetime.now().strftime(TIMESTAMP_FORMAT)
-                    wav_file = os.path.join(self.output_path, f"temp_{timestamp}.wav")
-                    mp3_file = os.path.join(self.output_path, f"{OUTPUT_FILE_PREFIX}{timestamp}.mp3")
+                    # Filename is based on when the recording started
+                    mp3_file = _pjoin(self.output_path, f"{OUTPUT_FILE_PREFIX}{timestamp}.mp3")
 
                     # Ensure output folder exists
                     os.makedirs(self.output_path, exist_ok=True)
 
-                    # Save to WAV
-                    self.recorder.save_to_wav(wav_file)
+                    # The recording thread may still be draining the last
+                    # buffers into the recorder
+                    self.recorder.wait_until_finished()
 
-                    # Encode to MP3
-                    bitrate = self.get_selected_bitrate()
-                    self.encoder = MP3Encoder(bitrate=bitrate)
-                    self.encoder.convert_wav_to_mp3(wav_file, mp3_file, delete_wav=True)
+                    if not self.recorder.frame_count:
+                        raise AudioRecorderError("No audio data to save")
+
+                    # Encode to MP3 block by block from the recorded buffers
+                    self._ensure_encoder().encode_pcm_stream(
+                        self.recorder.iter_frames(), mp3_file,
+                        sample_rate=self.recorder.sample_rate,
+                        channels=self.recorder.channels
+                    )
 
                     # Success
-                    saved_file = mp3_file
-                    self.root.after(0, lambda file=saved_file: self.on_save_success(file))
+                    self._post("SaveSuccess", mp3_file)
 
                 except (AudioRecorderError, MP3EncoderError) as e:
                     logger.error(f"Save error: {e}")
-                    error_msg = str(e)
-                    self.root.after(0, lambda msg=error_msg: self.on_save_error(msg))
-                finally:
-                    # Clean up WAV file if it still exists
-                    if os.path.exists(wav_file):
-                        try:
-                            os.remove(wav_file)
-                        except Exception as e:
-                            logger.warning(f"Failed to delete temp WAV: {e}")
-
-            Thread(target=save_thread, daemon=True).start()
+                    self._post("SaveError", str(e))
+
+            self._submit(save_thread)
 
         except Exception as e:
             logger.error(f"Failed to stop recording: {e}")
@@ -648,6 +1030,10 @@ class AudioRecorderGUI:
         messagebox.showerror("Aufnahmefehler", f"Fehler bei der Aufnahme:\n{error_msg}")
         self.reset_ui()
 
+        # The cached device list may be stale (e.g. the device was unplugged),
+        # so this is the one case where devices are re-enumerated automatically
+        self.refresh_devices()
+
     def on_save_success(self, filename: str) -> None:
         """
         Handle successful save.
@@ -656,20 +1042,18 @@ class AudioRecorderGUI:
             filename: Path to saved file
         """
         file_size_mb = os.path.getsize(filename) / (1024 * 1024)
-        self.status_label.config(
-            text=f"✅ Gespeichert: {os.path.basename(filename)}",
-            bootstyle="success"
-        )
-        messagebox.showinfo(
-            "Fertig",
-            f"Aufnahme erfolgreich gespeichert!\n\n"
-            f"Datei: {os.path.basename(filename)}\n"
-            f"Größe: {file_size_mb:.2f} MB\n"
-            f"Ort: {self.output_path}"
+        self._set_label_text(
+            self.save_info_label,
+            f"✅ Gespeichert: {os.path.basename(filename)} "
+            f"({file_size_mb:.2f} MB) in {self.output_path}"
         )
         self.reset_ui()
+        self._release_encoder()
         logger.info(f"Recording saved successfully: {filename}")
 
+        # Release the recorded audio buffer right away
+        self.root.after(0, self.recorder.clear_data)
+
     def on_save_error(self, error_msg: str) -> None:
         """
         Handle save error.
@@ -677,81 +1061,306 @@ class AudioRecorderGUI:
         Args:
             error_msg: Error message
         """
-        self.status_label.config(text="❌ Fehler beim Speichern", bootstyle="danger")
+        self._set_status("❌ Fehler beim Speichern", "danger")
+        self._release_encoder()
         messagebox.showerror("Speicherfehler", f"Fehler beim Speichern:\n{error_msg}")
         self.reset_ui()
 
+    def _start_ticker(self) -> None:
+        """Start the periodic UI updates for a recording."""
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+        self._tick()
+
+    def _stop_ticker(self) -> None:
+        """Cancel the periodic UI updates and reset the displays."""
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
+        self.update_display()
+        self.update_audio_level()
+
+    def _tick(self) -> None:
+        """Periodic time display update while recording (the level meter is push-based)."""
+        if not self.is_recording:
+            self._tick_id = None
+            return
+
+        self.update_display()
+
+        # Schedule the next tick just after the elapsed time rolls over to the
+        # next interval, so each tick shows a new value
+        elapsed_ms = int(self.elapsed_time * 1000)
+        delay = _TICK_INTERVAL_MS - elapsed_ms % _TICK_INTERVAL_MS
+        self._tick_id = self.root.after(delay + TICK_ALIGN_SLACK_MS, self._tick)
+
+    def _push_level(self, level: float) -> None:
+        """
+        Receive an audio level from the recording thread.
+
+        Only the latest level is kept, and the UI thread is woken through a
+        virtual event only if no update is already pending. Levels are
+        dropped while the window is minimized.
+
+        Args:
+            level: Audio level (0.0 to 1.0)
+        """
+        if not self._visible or self._closing:
+            return
+
+        with self._level_lock:
+            self._level_latest = level
+            if self._level_tick_pending:
+                # The queued tick will pick up the new value
+                return
+            self._level_tick_pending = True
+
+        try:
+            self.root.event_generate("<<LevelTick>>", when="tail")
+        except (TclError, RuntimeError):
+            if not self._closing:
+                raise
+
+    def set_level_fps(self, fps: int) -> None:
+        """
+        Set how often the level meter is updated.
+
+        Takes effect immediately, also during a recording.
+
+        Args:
+            fps: Level meter updates per second
+        """
+        self._level_interval_s = 1.0 / max(1, fps)
+        if self.recorder is not None:
+            self.recorder.level_interval = self._level_interval_s
+        logger.info(f"Level meter rate set to {max(1, fps)} fps")
+
+    def _on_visibility_change(self, event) -> None:
+        """
+        Remember whether the main window is shown.
+
+        Args:
+            event: Map or Unmap event (child widgets are ignored)
+        """
+        if event.widget is not self.root:
+            return
+
+        self._visible = event.type == EventType.Map
+        logger.debug(f"Window visible: {self._visible}")
+
+    def _submit(self, fn, *args) -> Future:
+        """
+        Run a function on the shared worker threads.
+
+        Args:
+            fn: Function to run
+            *args: Arguments for fn
+
+        Returns:
+            Future of the call; unexpected exceptions are logged
+        """
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._log_worker_error)
+        return future
+
+    @staticmethod
+    def _log_worker_error(future: Future) -> None:
+        """
+        Log an exception that escaped a worker function.
+
+        Args:
+            future: Finished future from _submit
+        """
+        if not future.cancelled() and future.exception() is not None:
+            error = future.exception()
+            logger.error(f"Background task failed: {error}",
+                         exc_info=(type(error), error, error.__traceback__))
+
+    def shutdown(self) -> None:
+        """
+        Stop accepting background work; call when the window is closed.
+
+        A save in progress may still finish writing its file, but its result
+        is no longer posted to the (destroyed) window. A running recording is
+        stopped, so its worker thread does not keep the process alive.
+        """
+        self._closing = True
+        if self.recorder is not None:
+            self.recorder.stop_event.set()
+        self._executor.shutdown(wait=False)
+
+    def _post(self, name: str, payload=None) -> None:
+        """
+        Hand a result from a worker thread to the UI thread.
+
+        The payload is stored under a lock and the virtual event <<name>> is
+        queued, so Tk is never driven from outside the UI thread.
+
+        Args:
+            name: Event name without brackets, e.g. "SaveSuccess"
+            payload: Value for the handler, fetched with _take_pending
+        """
+        if self._closing:
+            return
+        with self._pending_lock:
+            self._pending_msg[name] = payload
+        try:
+            self.root.event_generate(f"<<{name}>>", when="tail")
+        except (TclError, RuntimeError):
+            # The window was destroyed after the check above
+            if not self._closing:
+                raise
+
+    def _take_pending(self, name: str):
+        """
+        Take the payload a worker thread posted for a virtual event.
+
+        Args:
+            name: Event name without brackets, e.g. "SaveSuccess"
+
+        Returns:
+            The posted payload, or None if there is none
+        """
+        with self._pending_lock:
+            return self._pending_msg.pop(name, None)
+
+    def _set_label_text(self, label: ttk.Label, text: str) -> None:
+        """
+        Set a label's text, skipping the Tk call if the text is unchanged.
+
+        Args:
+            label: Label widget to update
+            text: New text
+        """
+        self._configure_changed(label, text=text)
+
+    def _set_status(self, text: str, bootstyle: str) -> None:
+        """
+        Set the status line, skipping the Tk call if nothing changed.
+
+        Args:
+            text: Status text
+            bootstyle: ttkbootstrap color of the status text
+        """
+        self._configure_changed(self.status_label, text=text, bootstyle=bootstyle)
+
+    def _configure_changed(self, widget, **options) -> None:
+        """
+        Configure only the widget options whose value differs from the last one set.
+
+        Options set directly with configure() bypass this cache, so widgets
+        updated through this helper should not be configured elsewhere.
+
+        Args:
+            widget: Widget to configure
+            **options: Widget options, e.g. text=..., state=...
+        """
+        last = self._widget_options.setdefault(widget, {})
+        changed = {
+            key: value for key, value in options.items()
+            if key not in last or last[key] != value
+        }
+        if changed:
+            widget.configure(**changed)
+            last.update(changed)
+
     def update_display(self) -> None:
         """Update time display and countdown."""
         if self.is_recording:
-            # Show elapsed time
-            mins, secs = divmod(int(self.elapsed_time), 60)
-            self.time_label.config(text=f"Laufzeit: {mins:02d}:{secs:02d}")
+            # Show elapsed time (only formatted when the second changes)
+            elapsed = int(self.elapsed_time)
+            if elapsed != self._last_elapsed_sec:
+                self._last_elapsed_sec = elapsed
+                mins, secs = divmod(elapsed, 60)
+                self._set_label_text(self.time_label, f"Laufzeit: {mins:02d}:{secs:02d}")
+
+            # Show countdown if timer is active (the deadline is cleared
+            # whenever the timer is switched off)
+            if self._timer_deadline_monotonic is not None:
+                remaining = int(self._timer_deadline_monotonic - time.monotonic())
+                if remaining == self._last_remaining_sec:
+                    return
+                self._last_remaining_sec = remaining
 
-            # Show countdown if timer is active
-            if self.timer_enabled.get() and self.timer_end_time:
-                remaining = (self.timer_end_time - datetime.datetime.now()).total_seconds()
                 if remaining > 0:
-                    remaining_mins, remaining_secs = divmod(int(remaining), 60)
-                    self.countdown_label.config(
-                        text=f"⏱️ Verbleibend: {remaining_mins:02d}:{remaining_secs:02d}"
+                    remaining_mins, remaining_secs = divmod(remaining, 60)
+                    self._set_label_text(
+                        self.countdown_label,
+                        f"⏱️ Verbleibend: {remaining_mins:02d}:{remaining_secs:02d}"
                     )
                 else:
-                    self.countdown_label.config(text="⏱️ Timer abgelaufen")
+                    self._set_label_text(self.countdown_label, "⏱️ Timer abgelaufen")
             else:
-                self.countdown_label.config(text="")
-
-            self.root.after(TIMER_DISPLAY_INTERVAL_MS, self.update_display)
+                self._last_remaining_sec = None
+                self._set_label_text(self.countdown_label, "")
         else:
-            self.time_label.config(text="Laufzeit: 00:00")
-            self.countdown_label.config(text="")
+            self._last_elapsed_sec = None
+            self._last_remaining_sec = None
+            self._set_label_text(self.time_label, "Laufzeit: 00:00")
+            self._set_label_text(self.countdown_label, "")
+
+    def update_audio_level(self, event=None) -> None:
+        """Update audio level indicator with the latest pushed level."""
+        with self._level_lock:
+            level = self._level_latest if self._level_tick_pending else None
+            self._level_tick_pending = False
 
-    def update_audio_level(self) -> None:
-        """Update audio level indicator."""
         if self.is_recording and not self.is_paused:
-            try:
-                level = self.recorder.get_audio_level()
-                # Update progress bar (0-100)
-                self.level_meter['value'] = level * 100
+            if level is None:
+                return
 
-                # Change color based on level
+            try:
+                # Update progress bar (0-100), only when the visible value changes
+                value = int(level * 100)
+                if value != self._level_value:
+                    self.level_meter['value'] = value
+                    self._level_value = value
+
+                # Change color based on level (restyling is expensive, so
+                # only do it when the band actually changes)
                 if level > 0.9:
-                    self.level_meter.config(bootstyle="danger-striped")
+                    band = "danger"
                 elif level > 0.7:
-                    self.level_meter.config(bootstyle="warning-striped")
+                    band = "warning"
                 else:
-                    self.level_meter.config(bootstyle="success-striped")
+                    band = "success"
+
+                if band != self._level_band:
+                    self.level_meter.configure(style=self._level_styles[band])
+                    self._level_band = band
 
             except Exception as e:
                 logger.error(f"Failed to update audio level: {e}")
-
-            self.root.after(100, self.update_audio_level)
-        else:
+        elif self._level_value != 0:
             # Reset level meter
             self.level_meter['value'] = 0
+            self._level_value = 0
+
+    def _apply_profile(self, profile: list) -> None:
+        """
+        Apply a UI state profile in one batch and flush pending redraws once.
+
+        Args:
+            profile: List of (widget, options) pairs passed to configure()
+        """
+        for widget, options in profile:
+            self._configure_changed(widget, **options)
+        self.root.update_idletasks()
 
     def reset_ui(self) -> None:
         """Reset UI to initial state."""
         self.is_recording = False
         self.is_paused = False
         self.timer_end_time = None
+        self._timer_deadline_monotonic = None
+        self._stop_ticker()
 
         # Cancel any scheduled timer stop
-        if self.timer_stop_scheduled:
-            self.root.after_cancel(self.timer_stop_scheduled)
-            self.timer_stop_scheduled = None
-
-        self.status_label.config(text="⚫ Bereit", bootstyle="dark")
-        self.start_button.config(state=NORMAL)
-        self.pause_button.config(state=DISABLED, text="⏸️ Pause")
-        self.stop_button.config(state=DISABLED)
-        self.device_combo.config(state="readonly")
-        self.timer_minutes.config(state=NORMAL)
-        self.timer_seconds.config(state=NORMAL)
-        self.timer_button.config(state=NORMAL)
-        self.time_label.config(text="Laufzeit: 00:00")
-        self.countdown_label.config(text="")
-        self.level_meter['value'] = 0
+        if self._stop_after_id:
+            self.root.after_cancel(self._stop_after_id)
+            self._stop_after_id = None
+
+        self._apply_profile(self._ui_profile_idle)
 
         # Update timer end display if still enabled
         if self.timer_enabled.get():
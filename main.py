@@ -8,11 +8,10 @@ License: MIT
 
 import sys
 import logging
+import tkinter as tk
+from importlib.util import find_spec
 from tkinter import messagebox
 
-import ttkbootstrap as ttk
-
-from gui import AudioRecorderGUI
 from config import GUI_THEME
 
 
@@ -45,10 +44,10 @@ def check_dependencies():
 
     missing = []
 
+    # Only look the modules up; importing them here would run their
+    # start-up code a second time
     for module_name, pip_name in required_modules.items():
-        try:
-            __import__(module_name)
-        except ImportError:
+        if find_spec(module_name) is None:
             missing.append(pip_name)
 
     if missing:
@@ -64,6 +63,26 @@ def check_dependencies():
     return True
 
 
+def show_splash():
+    """
+    Show a small splash window while the GUI and audio modules load.
+
+    Returns:
+        The splash window; destroy it once the main window is ready
+    """
+    splash = tk.Tk()
+    splash.overrideredirect(True)
+    tk.Label(splash, text="🎙️ Musik-Snip wird gestartet…", padx=30, pady=20).pack()
+
+    # Center on screen
+    splash.update_idletasks()
+    x = (splash.winfo_screenwidth() - splash.winfo_reqwidth()) // 2
+    y = (splash.winfo_screenheight() - splash.winfo_reqheight()) // 2
+    splash.geometry(f"+{x}+{y}")
+    splash.update()
+    return splash
+
+
 def main():
     """Main entry point for the application."""
     # Setup logging
@@ -77,6 +96,16 @@ def main():
         logger.error("Missing dependencies, exiting")
         sys.exit(1)
 
+    # ttkbootstrap and the GUI are imported behind a splash window, so
+    # something is on screen while they load
+    splash = show_splash()
+    try:
+        import ttkbootstrap as ttk
+        from gui import AudioRecorderGUI
+    finally:
+        splash.destroy()
+
+    app = None
     try:
         # Create main window with modern theme
         root = ttk.Window(themename=GUI_THEME)
@@ -92,8 +121,10 @@ def main():
                     "Eine Aufnahme ist noch aktiv. Wirklich beenden?"
                 ):
                     app.recorder.stop_recording()
+                    app.shutdown()
                     root.destroy()
             else:
+                app.shutdown()
                 root.destroy()
 
         root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -105,6 +136,9 @@ def main():
 
     except Exception as e:
         logger.critical(f"Application crashed: {e}", exc_info=True)
+        if app is not None:
+            # Stops a running recording, whose worker would keep the process alive
+            app.shutdown()
         messagebox.showerror(
             "Kritischer Fehler",
             f"Die Anwendung ist abgestürzt:\n{e}\n\n"
@@ -3,12 +3,14 @@ Audio recording functionality using PyAudioWPatch for WASAPI Loopback.
 """
 
 import os
+import math
 import logging
 import datetime
+import importlib.util
 import numpy as np
 import soundfile as sf
-from typing import Optional, Callable, List
-from threading import Event
+from typing import Optional, Callable, List, Iterator
+from threading import Event, Thread
 import time
 
 try:
@@ -19,8 +21,12 @@ except ImportError:
     PYAUDIO_AVAILABLE = False
     logging.warning("PyAudioWPatch not available, loopback recording may not work")
 
+# numba is imported when the first recording starts, not at module import
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
 from config import (
-    SAMPLE_RATE, CHANNELS, AUDIO_DTYPE, BUFFER_SIZE,
+    SAMPLE_RATE, CHANNELS, AUDIO_DTYPE, BUFFER_SIZE, ARENA_INITIAL_SECONDS, ARENA_MAX_PREALLOC_SECONDS, RING_BUFFER_SAMPLES, PROGRESS_INTERVAL_S,
+    WARMUP_MIN_MS, WARMUP_MIN_BUFFERS, ENCODE_CHUNK_FRAMES, LEVEL_SMOOTHING, LEVEL_FPS,
     OUTPUT_FOLDER, TEMP_FILE_PREFIX, OUTPUT_FILE_PREFIX, TIMESTAMP_FORMAT
 )
 
@@ -28,11 +34,197 @@ from config import (
 logger = logging.getLogger(__name__)
 
 
+def _buffer_rms_int16(samples: np.ndarray) -> float:
+    """
+    RMS of an int16 buffer, normalised to 0..1.
+
+    The sum of squares runs on the int16 samples with an int64
+    accumulator, so no float copy of the buffer is made.
+
+    Args:
+        samples: Flat, non-empty int16 array
+
+    Returns:
+        RMS as float
+    """
+    sum_sq = float(np.einsum('i,i->', samples, samples, dtype=np.int64))
+    return math.sqrt(sum_sq / samples.size) / 32768.0
+
+
+def _buffer_rms_float32(samples: np.ndarray) -> float:
+    """
+    RMS of a float32 buffer.
+
+    Args:
+        samples: Flat, non-empty float32 array
+
+    Returns:
+        RMS as float
+    """
+    # Sum of squares via BLAS dot
+    return math.sqrt(float(np.dot(samples, samples)) / samples.size)
+
+
+def _sum_sq(samples):
+    """Sum of squares of the samples in a single pass."""
+    sum_sq = 0.0
+    for i in range(samples.shape[0]):
+        v = float(samples[i])
+        sum_sq += v * v
+    return sum_sq
+
+
+def _buffer_rms_numba(samples: np.ndarray) -> float:
+    """
+    RMS of a buffer via the compiled single-pass kernel.
+
+    Args:
+        samples: Flat, non-empty array of _NP_DTYPE
+
+    Returns:
+        RMS as float
+    """
+    return math.sqrt(_stats_kernel(samples) / samples.size) * _SAMPLE_SCALE
+
+
+_stats_kernel = None  # Compiled Numba kernel, built when the first recording starts
+
+
+def _prepare_buffer_stats() -> None:
+    """
+    Compile the Numba level kernel and switch _buffer_rms over to it.
+
+    Called before the stream opens, so compilation never happens on the
+    audio thread. Without numba, or if compilation fails, the NumPy
+    version stays in use.
+    """
+    global _stats_kernel, _buffer_rms
+    if _stats_kernel is not None or not NUMBA_AVAILABLE:
+        return
+    try:
+        import numba
+        kernel = numba.njit(fastmath=True, boundscheck=False, cache=True)(_sum_sq)
+        # Compile for the stream's dtype now
+        kernel(np.zeros(2, dtype=_NP_DTYPE))
+    except Exception as e:
+        logger.warning(f"Numba level kernel unavailable, using NumPy: {e}")
+        return
+    _stats_kernel = kernel
+    _buffer_rms = _buffer_rms_numba
+
+
+# Sample format, resolved once so the per-buffer path has no format checks
+if AUDIO_DTYPE == 'int16':
+    _NP_DTYPE = np.int16
+    _PA_FORMAT = pyaudio.paInt16
+    _WAV_SUBTYPE = 'PCM_16'
+    _SAMPLE_SCALE = 1.0 / 32768.0
+    _buffer_rms = _buffer_rms_int16
+else:
+    _NP_DTYPE = np.float32
+    _PA_FORMAT = pyaudio.paFloat32
+    _WAV_SUBTYPE = 'FLOAT'
+    _SAMPLE_SCALE = 1.0
+    _buffer_rms = _buffer_rms_float32
+
+
 class AudioRecorderError(Exception):
     """Custom exception for audio recording errors."""
     pass
 
 
+class _PyAudioBackend:
+    """
+    PortAudio stream handling for AudioRecorder, via PyAudioWPatch or PyAudio.
+
+    Keeps everything library-specific (instance lifetime, device queries,
+    the callback signature) out of the recorder, which only sees numpy
+    buffers.
+    """
+
+    def __init__(self):
+        self._pa = None
+        self._stream = None
+
+    def prepare(self, device_index: Optional[int], sample_rate: int) -> int:
+        """
+        Initialise PortAudio and pick a buffer size for the device.
+
+        The device's low input latency is rounded up to whole frames and
+        then to a power of two, but never below BUFFER_SIZE.
+
+        Args:
+            device_index: Device to be opened, or None for the default device
+            sample_rate: Sample rate the stream will use
+
+        Returns:
+            Frames per buffer for the stream
+        """
+        self._pa = pyaudio.PyAudio()
+        try:
+            if device_index is None:
+                info = self._pa.get_default_input_device_info()
+            else:
+                info = self._pa.get_device_info_by_index(device_index)
+            latency = float(info.get('defaultLowInputLatency', 0.0))
+        except Exception as e:
+            logger.debug(f"Could not query device latency: {e}")
+            return BUFFER_SIZE
+
+        frames = int(math.ceil(latency * sample_rate))
+        if frames <= BUFFER_SIZE:
+            return BUFFER_SIZE
+        return 1 << (frames - 1).bit_length()
+
+    def start(self, device_index: Optional[int], sample_rate: int, channels: int,
+              frames_per_buffer: int, on_buffer: Callable[[np.ndarray, int, int], None]) -> None:
+        """
+        Open and start the input stream.
+
+        Args:
+            device_index: Device to open, or None for the default device
+            sample_rate: Sample rate in Hz
+            channels: Number of channels
+            frames_per_buffer: Frames per callback
+            on_buffer: Called on PortAudio's thread with (samples, frame_count,
+                status) for every buffer; samples is a flat _NP_DTYPE view
+        """
+        def callback(in_data, frame_count, time_info, status):
+            on_buffer(np.frombuffer(in_data, dtype=_NP_DTYPE), frame_count, status)
+            return (None, pyaudio.paContinue)
+
+        self._stream = self._pa.open(
+            format=_PA_FORMAT,
+            channels=channels,
+            rate=sample_rate,
+            input=True,
+            input_device_index=device_index,
+            frames_per_buffer=frames_per_buffer,
+            stream_callback=callback
+        )
+
+    def is_active(self) -> bool:
+        """Whether the stream is still delivering buffers."""
+        return self._stream is not None and self._stream.is_active()
+
+    def close(self) -> None:
+        """Stop and close the stream and release PortAudio. Safe to call twice."""
+        if self._stream is not None:
+            try:
+                self._stream.stop_stream()
+                self._stream.close()
+            except Exception as e:
+                logger.warning(f"Error closing stream: {e}")
+            self._stream = None
+
+        if self._pa is not None:
+            try:
+                self._pa.terminate()
+            except Exception as e:
+                logger.warning(f"Error terminating PyAudio: {e}")
+            self._pa = None
+
+
 class AudioRecorder:
     """
     Handles audio recording from system audio device using WASAPI Loopback.
@@ -41,6 +233,8 @@ class AudioRecorder:
         sample_rate: Audio sample rate in Hz
         channels: Number of audio channels (1=mono, 2=stereo)
         device: Audio device info dict or device index
+        level_interval: Minimum seconds between level callbacks
+        frames_per_buffer: Stream buffer size used by the last recording
     """
 
     def __init__(self, sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS,
@@ -55,17 +249,89 @@ class AudioRecorder:
         """
         self.sample_rate = sample_rate
         self.channels = channels
+        self._default_sample_rate = sample_rate  # Used when no device is selected
+        self._default_channels = channels
         self.device = device
         self.is_recording = False
         self.is_paused = False
-        self.frames: List[bytes] = []
+        self._arena: Optional[np.ndarray] = None  # Preallocated capture buffer (interleaved samples)
+        self._write_idx = 0  # Number of samples written to the arena
+        self._ring: Optional[np.ndarray] = None  # Hand-off from the audio callback to the writer thread
+        self._ring_w = 0  # Total samples pushed by the callback (only it writes this)
+        self._ring_claim = 0  # End of the push in progress; samples before claim - size may be overwritten
+        self._ring_r = 0  # Total samples drained by the writer thread (only it writes this)
+        self._ring_ready = Event()
+        self._drain_thread: Optional[Thread] = None
+        self._drain_stop = False  # Set once the stream is closed and the ring can run dry
+        self._dropped_samples = 0  # Overwritten before the writer thread got to them
+        self._folder_ready = False  # OUTPUT_FOLDER known to exist; created on first save
         self.stop_event = Event()
+        self._capture_done = Event()  # Set once the stream is closed and the ring drained
+        self._capture_done.set()
+        self._reserved = False  # begin_recording() ran; start_recording has not yet
         self.pause_event = Event()
-        self.pyaudio_instance = None
-        self.stream = None
+        self._backend = _PyAudioBackend()
         self.current_level = 0.0
+        self.level_interval = 1.0 / LEVEL_FPS  # Seconds between level callbacks
+        self.frames_per_buffer = BUFFER_SIZE  # Chosen per device when recording starts
+        self._stream_started = False  # Set once the warm-up buffers have arrived
+        self._warmup_buffers = 0
+        self._warmup_frames = 0
+
+        # Resolve the stream format up front so callers can see it before recording
+        self._apply_device_settings()
+
+        logger.info(f"AudioRecorder initialized: rate={self.sample_rate}, channels={self.channels}, device={device}")
+
+    def _apply_device_settings(self) -> Optional[int]:
+        """
+        Update sample rate and channel count from the selected device.
+
+        Returns:
+            Device index to open, or None for the default device
+        """
+        device_index = None
+        device_channels = self.channels
+        device_sample_rate = self.sample_rate
+
+        if self.device:
+            device_index = self.device.get('id')
+            device_channels = self.device.get('channels', self.channels)
+            device_sample_rate = int(self.device.get('sample_rate', self.sample_rate))
+
+        # Update recorder settings based on device
+        self.sample_rate = device_sample_rate
+        # Use stereo if device supports it, otherwise use device's max channels
+        if device_channels >= 2:
+            self.channels = 2
+        else:
+            self.channels = device_channels
+
+        return device_index
+
+    def set_device(self, device: Optional[dict]) -> None:
+        """
+        Select the device for the next recording.
+
+        Only the device info is stored; the stream is opened when recording
+        starts, so switching devices does not touch PyAudio.
 
-        logger.info(f"AudioRecorder initialized: rate={sample_rate}, channels={channels}, device={device}")
+        Args:
+            device: Device info dict with 'index', 'name', 'is_loopback', etc.,
+                or None for the default loopback device
+
+        Raises:
+            AudioRecorderError: If a recording is in progress
+        """
+        if self.is_recording:
+            raise AudioRecorderError("Cannot change device while recording")
+
+        self.device = device
+        # Start from the defaults, not the previous device's format
+        self.sample_rate = self._default_sample_rate
+        self.channels = self._default_channels
+        self._apply_device_settings()
+        logger.info(f"Device set: rate={self.sample_rate}, channels={self.channels}, device={device}")
 
     @staticmethod
     def get_audio_devices() -> List[dict]:
@@ -135,116 +401,112 @@ class AudioRecorder:
             return []
 
     def start_recording(self, duration: Optional[float] = None,
-                       callback: Optional[Callable[[float], None]] = None) -> None:
+                       callback: Optional[Callable[[float], None]] = None,
+                       level_callback: Optional[Callable[[float], None]] = None) -> None:
         """
         Start audio recording. This method BLOCKS until recording is finished.
 
         Args:
             duration: Recording duration in seconds (None = unlimited)
             callback: Optional callback function called with elapsed time
+            level_callback: Optional callback called with the current audio
+                level every level_interval seconds; like callback, it runs on
+                the thread that called start_recording, never the audio thread
 
         Raises:
             AudioRecorderError: If recording cannot be started
         """
-        if self.is_recording:
+        if self._reserved:
+            self._reserved = False
+        elif self.is_recording:
             logger.warning("Recording already in progress")
             return
+        else:
+            self.begin_recording()
+
+        if self.stop_event.is_set():
+            # Stopped between begin_recording() and now; nothing was captured
+            logger.info("Recording cancelled before it started")
+            self._capture_done.set()
+            return
 
         try:
-            self.is_recording = True
-            self.is_paused = False
-            self.frames = []
-            self.stop_event.clear()
             self.current_level = 0.0
+            self._stream_started = False
+            self._warmup_buffers = 0
+            self._warmup_frames = 0
 
-            # Get device info
-            device_index = None
-            device_channels = self.channels
-            device_sample_rate = self.sample_rate
+            # Get device info and update recorder settings based on device
+            device_index = self._apply_device_settings()
 
             if self.device:
-                device_index = self.device.get('id')
-                device_channels = self.device.get('channels', self.channels)
-                device_sample_rate = int(self.device.get('sample_rate', self.sample_rate))
                 logger.info(f"Using device {device_index}: {self.device.get('name')}")
             else:
                 # Use default loopback device
                 logger.info("Using default loopback device")
 
-            # Update recorder settings based on device
-            self.sample_rate = device_sample_rate
-            # Use stereo if device supports it, otherwise use device's max channels
-            if device_channels >= 2:
-                self.channels = 2
-            else:
-                self.channels = device_channels
-
             logger.info(f"Starting recording (duration={duration}s, rate={self.sample_rate}, channels={self.channels})")
 
-            # Initialize PyAudio
-            self.pyaudio_instance = pyaudio.PyAudio()
+            # Initialize PortAudio
+            self.frames_per_buffer = self._backend.prepare(device_index, self.sample_rate)
+            _prepare_buffer_stats()
 
-            # Determine audio format
-            if AUDIO_DTYPE == 'float32':
-                audio_format = pyaudio.paFloat32
-            elif AUDIO_DTYPE == 'int16':
-                audio_format = pyaudio.paInt16
-            else:
-                audio_format = pyaudio.paFloat32
+            # Size the capture buffer for the whole recording up front if the
+            # duration is known, so the read loop never has to grow it
+            self._allocate_arena(duration)
+
+            # The callback only copies into the ring; storing and writing to
+            # disk happens on the writer thread
+            self._start_drain()
 
             # Open stream
-            self.stream = self.pyaudio_instance.open(
-                format=audio_format,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                input_device_index=device_index,
-                frames_per_buffer=BUFFER_SIZE
-            )
+            self._backend.start(device_index, self.sample_rate, self.channels,
+                                self.frames_per_buffer, self._on_audio)
 
-            logger.info("Audio stream opened successfully")
+            logger.info(f"Audio stream opened successfully ({self.frames_per_buffer} frames per buffer)")
 
-            # Recording loop (BLOCKING)
-            start_time = time.time()
+            # PortAudio delivers the buffers to _on_audio on its own thread;
+            # this thread reports levels and progress and watches the duration
+            # limit, so listeners never run on the audio thread
+            start_time = time.monotonic()
+            next_progress = start_time
+            announced = False
+            timeout = self._tick_interval(level_callback)
 
             try:
-                while not self.stop_event.is_set():
+                # Sleeps until stop is signalled or the next report is due;
+                # shortened at the end so the duration limit is exact
+                while not self.stop_event.wait(timeout):
+                    now = time.monotonic()
+                    elapsed = now - start_time
                     # Check duration limit
-                    elapsed = time.time() - start_time
                     if duration and elapsed >= duration:
                         logger.info(f"Duration limit reached: {elapsed:.1f}s")
                         break
 
-                    # Call progress callback
-                    if callback:
-                        callback(elapsed)
-
-                    # Read audio data
-                    try:
-                        if not self.is_paused and self.stream.is_active():
-                            data = self.stream.read(BUFFER_SIZE, exception_on_overflow=False)
-                            self.frames.append(data)
-
-                            # Calculate audio level for visualization
-                            try:
-                                audio_array = np.frombuffer(data, dtype=np.float32 if AUDIO_DTYPE == 'float32' else np.int16)
-                                if len(audio_array) > 0:
-                                    if AUDIO_DTYPE == 'int16':
-                                        audio_array = audio_array.astype(np.float32) / 32768.0
-                                    # Calculate RMS and scale up for better visibility
-                                    rms = np.sqrt(np.mean(audio_array ** 2))
-                                    # Scale by 3 for better visibility (loopback audio can be quiet)
-                                    self.current_level = float(min(rms * 3.0, 1.0))
-                            except Exception as e:
-                                logger.debug(f"Level calculation error: {e}")
-                        elif self.is_paused:
-                            # When paused, still update but don't record
-                            time.sleep(0.05)
-                    except Exception as e:
-                        if not self.stop_event.is_set():
-                            logger.warning(f"Stream read error: {e}")
-
-                    time.sleep(0.01)  # Small delay to prevent CPU spinning
+                    if self._stream_started:
+                        if not announced:
+                            announced = True
+                            logger.info(
+                                f"Stream started: {self._warmup_buffers} buffers, "
+                                f"{self._warmup_frames / self.sample_rate:.2f} s buffered"
+                            )
+                        if level_callback:
+                            level_callback(self.current_level)
+
+                        # Call progress callback
+                        if callback and now >= next_progress:
+                            next_progress = now + PROGRESS_INTERVAL_S
+                            callback(elapsed)
+
+                    # level_interval may be changed while recording
+                    timeout = self._tick_interval(level_callback)
+                    if duration:
+                        timeout = min(timeout, max(duration - elapsed, 0.0))
+
+                    if not self._backend.is_active():
+                        logger.warning("Audio stream stopped unexpectedly")
+                        break
 
                 logger.info("Recording stopped")
 
@@ -254,34 +516,217 @@ class AudioRecorder:
 
             finally:
                 # Cleanup stream
-                if self.stream:
-                    try:
-                        self.stream.stop_stream()
-                        self.stream.close()
-                    except Exception as e:
-                        logger.warning(f"Error closing stream: {e}")
-
-                if self.pyaudio_instance:
-                    try:
-                        self.pyaudio_instance.terminate()
-                    except Exception as e:
-                        logger.warning(f"Error terminating PyAudio: {e}")
+                self._backend.close()
+                self._stop_drain()
+                self._capture_done.set()
 
         except Exception as e:
             logger.error(f"Failed to start recording: {e}")
             self.is_recording = False
-            if self.stream:
-                try:
-                    self.stream.close()
-                except:
-                    pass
-            if self.pyaudio_instance:
-                try:
-                    self.pyaudio_instance.terminate()
-                except:
-                    pass
+            self._backend.close()
+            self._stop_drain()
+            self._capture_done.set()
             raise AudioRecorderError(f"Failed to start recording: {e}")
 
+    def _tick_interval(self, level_callback: Optional[Callable[[float], None]]) -> float:
+        """
+        Seconds the recording thread sleeps between reports.
+
+        Args:
+            level_callback: The recording's level callback, if any
+
+        Returns:
+            level_interval if levels are pushed and that is shorter,
+            otherwise PROGRESS_INTERVAL_S
+        """
+        if level_callback:
+            return min(PROGRESS_INTERVAL_S, self.level_interval)
+        return PROGRESS_INTERVAL_S
+
+    def _on_audio(self, audio_array: np.ndarray, frame_count: int, status: int) -> None:
+        """
+        Stream callback; stores one captured buffer.
+
+        Runs on the audio thread, so it must not block or raise.
+
+        Args:
+            audio_array: Flat array of interleaved samples
+            frame_count: Number of frames in audio_array
+            status: Backend status flags
+        """
+        if status:
+            logger.debug(f"Stream status flags: {status}")
+        if self.is_paused or self.stop_event.is_set():
+            return
+
+        try:
+            self._ring_push(audio_array)
+
+            # The first buffers of a stream can be jittery; keep them but
+            # don't report levels until enough audio has come in
+            if not self._stream_started:
+                self._warmup_buffers += 1
+                self._warmup_frames += frame_count
+                if (self._warmup_buffers < WARMUP_MIN_BUFFERS
+                        and self._warmup_frames * 1000 < WARMUP_MIN_MS * self.sample_rate):
+                    return
+                # Logged by the recording thread; no I/O on the audio thread
+                self._stream_started = True
+
+            # Calculate audio level for visualization
+            if audio_array.size > 0:
+                rms = _buffer_rms(audio_array)
+                # Scale by 3 for better visibility (loopback audio can be quiet)
+                block_level = min(rms * 3.0, 1.0)
+                # Keep a moving average so GUI polls are a plain attribute read
+                self.current_level = (
+                    LEVEL_SMOOTHING * self.current_level
+                    + (1.0 - LEVEL_SMOOTHING) * block_level
+                )
+        except Exception as e:
+            logger.debug(f"Audio callback error: {e}")
+
+    def _start_drain(self) -> None:
+        """Allocate the ring buffer and start the writer thread that drains it."""
+        if self._ring is None or self._ring.dtype != _NP_DTYPE:
+            self._ring = np.empty(RING_BUFFER_SAMPLES, dtype=_NP_DTYPE)
+        self._ring_w = 0
+        self._ring_claim = 0
+        self._ring_r = 0
+        self._dropped_samples = 0
+        self._drain_stop = False
+        self._ring_ready.clear()
+        self._drain_thread = Thread(target=self._drain_loop, name="RecorderDrain", daemon=True)
+        self._drain_thread.start()
+
+    def _stop_drain(self) -> None:
+        """
+        Stop the writer thread once the ring is empty.
+
+        Call this only after the stream is closed, so nothing is pushed any more.
+        """
+        if self._drain_thread is None:
+            return
+        self._drain_stop = True
+        self._ring_ready.set()
+        self._drain_thread.join()
+        self._drain_thread = None
+        if self._dropped_samples:
+            logger.warning(f"Recording finished with {self.get_dropped_frames()} dropped frames")
+
+    def _ring_push(self, samples: np.ndarray) -> None:
+        """
+        Copy one captured buffer into the ring (audio callback side).
+
+        The callback never waits: if the writer thread has fallen a whole
+        ring behind, the oldest unread samples are overwritten and the
+        writer thread counts them as dropped.
+
+        Args:
+            samples: Flat array of interleaved samples
+        """
+        n = samples.size
+        size = self._ring.size
+        w = self._ring_w
+        # Announce the region being overwritten before touching it
+        self._ring_claim = w + n
+
+        start = w % size
+        first = min(n, size - start)
+        self._ring[start:start + first] = samples[:first]
+        if first < n:
+            # Wrap around to the front of the ring
+            self._ring[:n - first] = samples[first:]
+        # Publish only after the samples are in place
+        self._ring_w = w + n
+        self._ring_ready.set()
+
+    def _drain_loop(self) -> None:
+        """Writer thread: move samples from the ring into the arena."""
+        while True:
+            self._ring_ready.wait()
+            self._ring_ready.clear()
+            try:
+                self._drain_ring()
+            except Exception as e:
+                logger.error(f"Writer thread error: {e}")
+            if self._drain_stop and self._ring_r == self._ring_w:
+                break
+
+    def _drain_ring(self) -> None:
+        """Consume everything currently published in the ring."""
+        size = self._ring.size
+        r = self._ring_r
+        w = self._ring_w
+        while r < w:
+            if w - r > size:
+                # Lapped by the callback; skip to the oldest intact sample
+                self._drop_ring_samples(w - size - r)
+                r = w - size
+
+            start = r % size
+            end = min(start + (w - r), size)
+            arena_idx = self._write_idx
+            self._arena_write(self._ring[start:end])
+
+            # The callback may have overwritten part of the block while it
+            # was being copied; keep only what is still valid
+            lost = self._ring_claim - size - r
+            if lost > 0:
+                self._write_idx = arena_idx
+                self._drop_ring_samples(lost)
+                r += lost
+                w = self._ring_w
+                continue
+
+            r += end - start
+            # Free the space for the callback
+            self._ring_r = r
+
+        self._ring_r = r
+
+    def _drop_ring_samples(self, count: int) -> None:
+        """
+        Record samples lost to a ring overrun.
+
+        Args:
+            count: Number of samples skipped by the writer thread
+        """
+        self._dropped_samples += count
+        logger.warning(f"Writer thread fell behind; dropped {count // self.channels} frames")
+
+    def get_dropped_frames(self) -> int:
+        """
+        Get the number of frames lost because the writer thread fell behind.
+
+        Returns:
+            Dropped frames in the current or last recording
+        """
+        return self._dropped_samples // self.channels
+
+    def begin_recording(self) -> None:
+        """
+        Reserve the recorder for a recording that start_recording will run.
+
+        Call this on the thread that schedules start_recording on a worker,
+        before scheduling it. From then on the recorder counts as recording:
+        stop_recording() cancels the pending start, and wait_until_finished()
+        waits for it instead of returning for the previous take.
+
+        Raises:
+            AudioRecorderError: If a recording is already in progress
+        """
+        if self.is_recording:
+            raise AudioRecorderError("Recording already in progress")
+
+        self.is_recording = True
+        self.is_paused = False
+        self.stop_event.clear()
+        self._capture_done.clear()
+        # The previous take is no longer readable
+        self._write_idx = 0
+        self._reserved = True
+
     def stop_recording(self) -> None:
         """Stop the current recording."""
         if not self.is_recording:
@@ -293,6 +738,22 @@ class AudioRecorder:
         self.is_recording = False
         self.is_paused = False
 
+    def wait_until_finished(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the last recording's audio is completely stored.
+
+        stop_recording() only signals the recording thread; the stream is
+        closed and the ring drained afterwards. Call this before reading the
+        recorded data.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if capture has finished, False on timeout
+        """
+        return self._capture_done.wait(timeout)
+
     def pause_recording(self) -> None:
         """Pause the current recording."""
         if not self.is_recording:
@@ -311,38 +772,102 @@ class AudioRecorder:
         self.is_paused = False
         logger.info("Recording resumed")
 
+    def _allocate_arena(self, duration: Optional[float]) -> None:
+        """
+        Allocate the capture buffer for a new recording.
+
+        Timed recordings get their whole buffer up front, up to
+        ARENA_MAX_PREALLOC_SECONDS; longer ones grow like unlimited ones.
+
+        Args:
+            duration: Planned recording duration in seconds, or None if
+                unlimited (the buffer then starts at ARENA_INITIAL_SECONDS)
+        """
+        seconds = min(duration, ARENA_MAX_PREALLOC_SECONDS) if duration else ARENA_INITIAL_SECONDS
+        # One extra read buffer, since the last read can overshoot the duration
+        frames = int(seconds * self.sample_rate) + self.frames_per_buffer
+        self._arena = np.empty(frames * self.channels, dtype=_NP_DTYPE)
+        self._write_idx = 0
+
+    def _arena_write(self, samples: np.ndarray) -> None:
+        """
+        Append interleaved samples to the capture buffer, doubling it when full.
+
+        Args:
+            samples: Flat array of interleaved samples
+        """
+        end = self._write_idx + samples.size
+        if end > self._arena.size:
+            grown = np.empty(max(end, 2 * self._arena.size), dtype=self._arena.dtype)
+            grown[:self._write_idx] = self._arena[:self._write_idx]
+            self._arena = grown
+            logger.debug(f"Capture buffer grown to {grown.nbytes / (1024 * 1024):.0f} MB")
+
+        self._arena[self._write_idx:end] = samples
+        self._write_idx = end
+
+    def _ensure_output_folder(self) -> None:
+        """
+        Create OUTPUT_FOLDER once; later calls cost no filesystem access.
+
+        Raises:
+            OSError: If the folder cannot be created
+        """
+        if not self._folder_ready:
+            os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+            self._folder_ready = True
+
+    @property
+    def frame_count(self) -> int:
+        """Number of recorded frames (samples per channel)."""
+        return self._write_idx // self.channels
+
     def get_audio_data(self) -> Optional[np.ndarray]:
         """
         Get the recorded audio data as numpy array.
 
         Returns:
-            NumPy array with audio data, or None if no data
+            NumPy array with audio data (a view of the capture buffer, no
+            copy), or None if no data
         """
-        if not self.frames:
+        if not self._write_idx:
             logger.warning("No audio data recorded")
             return None
 
-        try:
-            # Convert bytes to numpy array
-            audio_bytes = b''.join(self.frames)
+        audio_data = self._shape_block(self._arena[:self._write_idx])
+        logger.info(f"Retrieved audio data: shape={audio_data.shape}, dtype={audio_data.dtype}")
+        return audio_data
 
-            if AUDIO_DTYPE == 'float32':
-                audio_data = np.frombuffer(audio_bytes, dtype=np.float32)
-            elif AUDIO_DTYPE == 'int16':
-                audio_data = np.frombuffer(audio_bytes, dtype=np.int16)
-            else:
-                audio_data = np.frombuffer(audio_bytes, dtype=np.float32)
+    def iter_frames(self, block_frames: int = ENCODE_CHUNK_FRAMES) -> Iterator[np.ndarray]:
+        """
+        Iterate over the recorded audio in blocks.
 
-            # Reshape to (samples, channels) if stereo
-            if self.channels > 1:
-                audio_data = audio_data.reshape(-1, self.channels)
+        The blocks are views of the capture buffer, so nothing is copied.
 
-            logger.info(f"Retrieved audio data: shape={audio_data.shape}, dtype={audio_data.dtype}")
-            return audio_data
+        Args:
+            block_frames: Number of frames per yielded block
 
-        except Exception as e:
-            logger.error(f"Failed to get audio data: {e}")
-            return None
+        Yields:
+            NumPy arrays with audio data, shape (frames,) for mono or
+            (frames, channels)
+        """
+        step = max(1, block_frames) * self.channels
+        for start in range(0, self._write_idx, step):
+            yield self._shape_block(self._arena[start:min(start + step, self._write_idx)])
+
+    def _shape_block(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Reshape interleaved samples to (frames, channels) for multichannel audio.
+
+        Args:
+            samples: Flat array of interleaved samples
+
+        Returns:
+            View of samples with the recorder's channel layout
+        """
+        if self.channels > 1:
+            return samples.reshape(-1, self.channels)
+        return samples
 
     def save_to_wav(self, filename: Optional[str] = None) -> str:
         """
@@ -362,18 +887,17 @@ class AudioRecorder:
             raise AudioRecorderError("No audio data to save")
 
         try:
-            # Create output folder if needed
-            if not os.path.exists(OUTPUT_FOLDER):
-                os.makedirs(OUTPUT_FOLDER)
-                logger.info(f"Created output folder: {OUTPUT_FOLDER}")
+            self._ensure_output_folder()
 
             # Generate filename if not provided
             if filename is None:
                 timestamp = datetime.datetime.now().strftime(TIMESTAMP_FORMAT)
                 filename = os.path.join(OUTPUT_FOLDER, f"{OUTPUT_FILE_PREFIX}{timestamp}.wav")
 
-            # Save to WAV file
-            sf.write(filename, audio_data, self.sample_rate)
+            # Same subtype as the capture dtype, so libsndfile stores the
+            # samples as they are instead of converting them
+            sf.write(filename, audio_data, self.sample_rate,
+                     subtype=_WAV_SUBTYPE, format='WAV')
             file_size_mb = os.path.getsize(filename) / (1024 * 1024)
             logger.info(f"Saved WAV file: {filename} ({file_size_mb:.2f} MB)")
 
@@ -385,15 +909,19 @@ class AudioRecorder:
 
     def get_audio_level(self) -> float:
         """
-        Get current audio level (RMS) for visualization.
+        Get current audio level (smoothed RMS) for visualization.
+
+        The level is maintained by the audio callback as each buffer
+        arrives, so this is a constant-time read.
 
         Returns:
             Audio level as float (0.0 to 1.0)
         """
-        return float(np.clip(self.current_level, 0.0, 1.0))
+        return self.current_level
 
     def clear_data(self) -> None:
         """Clear recorded audio data from memory."""
-        self.frames.clear()
+        self._arena = None
+        self._write_idx = 0
         self.current_level = 0.0
         logger.info("Audio data cleared")